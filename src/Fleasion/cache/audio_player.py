@@ -58,6 +58,9 @@ class AudioPlayerWidget(QWidget):
         self.stream = None
         self.playback_thread = None
         self.position_lock = threading.Lock()
+        # Stop signal of the current playback thread; each thread gets its own
+        # so one still winding down can't be revived by the next play
+        self._stop_event = threading.Event()
 
         self._load_audio()
         self._setup_ui()
@@ -168,16 +171,20 @@ class AudioPlayerWidget(QWidget):
 
         self.is_playing = True
         self.should_stop = False
+        self._stop_event = threading.Event()
         self.play_pause_btn.setText('⏸')
 
         # Start playback thread
-        self.playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
+        self.playback_thread = threading.Thread(
+            target=self._playback_worker, args=(self._stop_event, self.audio_data), daemon=True
+        )
         self.playback_thread.start()
 
     def _pause(self):
         """Pause playback."""
         self.is_playing = False
         self.should_stop = True
+        self._stop_event.set()
         self.play_pause_btn.setText('▶')
 
         if self.stream:
@@ -196,16 +203,24 @@ class AudioPlayerWidget(QWidget):
         # Start playing
         self._play()
 
-    def _playback_worker(self):
-        """Worker thread for audio playback."""
+    def _playback_worker(self, stop_event: threading.Event, audio_data: np.ndarray):
+        """Worker thread for audio playback.
+
+        Plays audio_data until stop_event is set or the end is reached; the
+        audio it was started with is used even if the source changes meanwhile.
+        """
         try:
             def callback(outdata, frames, time_info, status):
                 if status:
                     print(f'Audio callback status: {status}')
 
                 with self.position_lock:
+                    if stop_event.is_set():
+                        outdata[:] = 0
+                        return
+
                     start_pos = self.playback_position
-                    end_pos = min(start_pos + frames, len(self.audio_data))
+                    end_pos = min(start_pos + frames, len(audio_data))
                     chunk_size = end_pos - start_pos
 
                     if chunk_size <= 0 or self.should_stop:
@@ -214,7 +229,7 @@ class AudioPlayerWidget(QWidget):
                         return
 
                     # Get audio data and apply volume
-                    chunk = self.audio_data[start_pos:end_pos] * self.volume
+                    chunk = audio_data[start_pos:end_pos] * self.volume
                     outdata[:chunk_size] = chunk
 
                     # Fill remaining with silence
@@ -232,19 +247,22 @@ class AudioPlayerWidget(QWidget):
             )
 
             with self.stream:
-                while not self.should_stop:
+                while not self.should_stop and not stop_event.is_set():
                     time.sleep(0.01)
 
                     # Check if reached end
                     with self.position_lock:
-                        if self.playback_position >= len(self.audio_data):
+                        if self.playback_position >= len(audio_data):
                             self.should_stop = True
 
         except Exception as e:
-            print(f'Playback error: {e}')
+            if not stop_event.is_set():
+                print(f'Playback error: {e}')
         finally:
-            self.is_playing = False
-            self.play_pause_btn.setText('▶')
+            # A superseded thread leaves the state to the playback that replaced it
+            if stop_event is self._stop_event:
+                self.is_playing = False
+                self.play_pause_btn.setText('▶')
 
     def _start_scrub(self):
         """Called when user starts dragging progress slider."""
@@ -289,6 +307,7 @@ class AudioPlayerWidget(QWidget):
         """Stop playback and cleanup."""
         self.should_stop = True
         self.is_playing = False
+        self._stop_event.set()
 
         if self.stream:
             self.stream.stop()
@@ -299,6 +318,34 @@ class AudioPlayerWidget(QWidget):
 
         self.stopped.emit()
 
+    def unload(self):
+        """Stop playback and release the loaded audio."""
+        # The playback thread exits on its own stop event; no need to wait for it
+        self.stop()
+        self.stream = None
+        self.playback_thread = None
+
+        self.audio_data = None
+        self.duration = 0.0
+        with self.position_lock:
+            self.playback_position = 0
+
+        self.play_pause_btn.setText('▶')
+        self.progress_slider.setRange(0, 0)
+        self.progress_slider.setValue(0)
+        self.time_label.setText(f'00:00.000 / {self._format_time(self.duration)}')
+
+    def set_source(self, audio_file_path: str):
+        """Switch to another audio file, reusing this widget."""
+        self.unload()
+
+        self.audio_file_path = audio_file_path
+        self._load_audio()
+
+        self.progress_slider.setRange(0, int(self.duration * 1000))
+        self.time_label.setText(f'00:00.000 / {self._format_time(self.duration)}')
+        self.timer.start(50)
+
     def closeEvent(self, event):
         """Handle widget close."""
         self.stop()
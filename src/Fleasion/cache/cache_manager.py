@@ -3,6 +3,7 @@
 import json
 import gzip
 import hashlib
+import os
 import threading
 from pathlib import Path
 from datetime import datetime
@@ -10,6 +11,11 @@ from typing import Optional
 
 from ..utils import CONFIG_DIR, log_buffer
 
+try:
+    import orjson  # Optional: much faster index (de)serialization
+except ImportError:
+    orjson = None
+
 
 class CacheManager:
     """Manages cached Roblox assets organized by type."""
@@ -47,6 +53,8 @@ class CacheManager:
         self.index_file = self.cache_dir / 'index.json'
         self.config_manager = config_manager
         self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Serializes index writes across threads
+        self._change_callbacks: list = []
 
         # Create cache directory structure
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -59,20 +67,47 @@ class CacheManager:
         """Load cache index from disk."""
         if self.index_file.exists():
             try:
+                if orjson is not None:
+                    return orjson.loads(self.index_file.read_bytes())
                 with self.index_file.open('r', encoding='utf-8') as f:
                     return json.load(f)
-            except (json.JSONDecodeError, OSError):
+            except (ValueError, OSError):
                 pass
         return {'assets': {}, 'version': '1.0'}
 
     def _save_index(self):
         """Save cache index to disk."""
+        # Write to a temp file and swap it in so a crash mid-write never
+        # leaves a truncated index behind
+        tmp_file = self.index_file.with_suffix('.json.tmp')
         try:
-            with self.index_file.open('w', encoding='utf-8') as f:
-                json.dump(self.index, f, indent=2)
+            with self._save_lock:
+                if orjson is not None:
+                    tmp_file.write_bytes(orjson.dumps(self.index, option=orjson.OPT_INDENT_2))
+                else:
+                    with tmp_file.open('w', encoding='utf-8') as f:
+                        json.dump(self.index, f, indent=2)
+                os.replace(tmp_file, self.index_file)
         except OSError as e:
             log_buffer.log('Cache', f'Failed to save cache index: {e}')
 
+    def add_change_callback(self, callback):
+        """Register a callback invoked (from the writing thread) when assets are added or removed."""
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback):
+        """Unregister a change callback."""
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
+
+    def _notify_changed(self):
+        """Notify change callbacks that the asset index was mutated."""
+        for callback in self._change_callbacks.copy():
+            try:
+                callback()
+            except Exception:
+                pass  # Ignore callback errors
+
     def get_asset_type_name(self, type_id: int) -> str:
         """Get asset type name from ID."""
         return self.ASSET_TYPES.get(type_id, f'Unknown({type_id})')
@@ -131,6 +166,7 @@ class CacheManager:
                 }
 
                 self._save_index()
+            self._notify_changed()
             return True
 
         except Exception as e:
@@ -473,10 +509,13 @@ class CacheManager:
 
             with self._lock:
                 asset_key = f'{asset_type}_{asset_id}'
-                if asset_key in self.index['assets']:
+                removed = asset_key in self.index['assets']
+                if removed:
                     del self.index['assets'][asset_key]
                     self._save_index()
 
+            if removed:
+                self._notify_changed()
             return True
 
         except Exception as e:
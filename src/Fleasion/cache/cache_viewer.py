@@ -1,17 +1,33 @@
 """Cache viewer tab - simplified version for viewing cached assets."""
 
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QObject, QTimer, QThread, QThreadPool, QRunnable, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
     QTableWidgetItem, QLabel, QComboBox, QLineEdit, QMessageBox,
     QHeaderView, QFileDialog, QGroupBox, QSplitter, QTextEdit, QCheckBox,
-    QMenu, QScrollArea
+    QMenu, QScrollArea, QApplication
 )
 from PyQt6.QtGui import QPixmap, QImage
 from PIL import Image
+import numpy as np
 import io
+import os
+import json
+import base64
+import math
+import re
 import threading
+import time
 import gzip as gzip_module
+import itertools
+from functools import lru_cache
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import win32crypt
+except ImportError:
+    win32crypt = None  # Not on Windows; name resolution is unavailable
 
 from .cache_manager import CacheManager
 from .obj_viewer import ObjViewerPanel
@@ -21,83 +37,87 @@ from . import mesh_processing
 from ..utils import log_buffer, open_folder
 
 
+_UNITS = (('B', 1.0), ('KB', 1024.0), ('MB', 1048576.0), ('GB', 1073741824.0), ('TB', 1099511627776.0))
+
+
+@lru_cache(maxsize=256)
+def _format_size(size_bytes: int) -> str:
+    """Format size in bytes to human-readable string."""
+    # Each unit spans 10 powers of two, so log2 picks the unit without a loop
+    i = min(4, int(math.log2(max(size_bytes, 1))) // 10)
+    unit, divisor = _UNITS[i]
+    return f'{size_bytes / divisor:.1f} {unit}'
+
+
+# Maps every byte to itself if printable ASCII, else '.', for hex dumps
+_ASCII_TABLE = bytes(c if 32 <= c < 127 else 0x2E for c in range(256))
+
+# Texture pack map elements, in display order
+_TEXTUREPACK_MAPS = ('color', 'normal', 'metalness', 'roughness')
+
+
 class SearchWorkerThread(QThread):
     '''Worker thread for filtering assets without blocking UI.'''
 
     results_ready = pyqtSignal(list)
+    partial_ready = pyqtSignal(list)  # Matches from each scanned chunk, in order
 
-    def __init__(self, assets: list, search_text: str, asset_info: dict):
+    CHUNK_SIZE = 5000  # Assets scanned between partial results / stop checks
+
+    def __init__(self, assets: list, search_text: str, search_blobs: np.ndarray,
+                 candidates: np.ndarray | None = None):
         super().__init__()
         self.assets = assets
         self.search_text = search_text.strip().lower()
-        self.asset_info = asset_info
-        self._stop_requested = False
+        self.search_blobs = search_blobs  # One entry per asset
+        self.candidates = candidates  # Positions to scan, or None for all assets
+        self.match_positions: np.ndarray | None = None  # Set before results_ready
+        self._stop_requested = threading.Event()  # Set from the UI thread, read here
 
     def stop(self):
-        self._stop_requested = True
+        self._stop_requested.set()
 
     def run(self):
         '''Filter assets in background thread.'''
-        if not self.search_text or self._stop_requested:
+        if self._stop_requested.is_set():
+            return
+        if not self.search_text:
             self.results_ready.emit(self.assets)
             return
 
+        # Vectorized substring scan over the per-asset search text, a chunk at
+        # a time so the table fills early and a newer search cuts it short
         filtered = []
-        batch_size = 100  # Process in batches to allow interruption
-
-        for i in range(0, len(self.assets), batch_size):
-            if self._stop_requested:
+        hits = []
+        total = len(self.assets) if self.candidates is None else len(self.candidates)
+        for start in range(0, total, self.CHUNK_SIZE):
+            if self._stop_requested.is_set():
                 return
+            if self.candidates is None:
+                blobs = self.search_blobs[start:start + self.CHUNK_SIZE]
+                mask = np.strings.find(blobs, self.search_text) >= 0
+                positions = np.flatnonzero(mask) + start
+            else:
+                chunk = self.candidates[start:start + self.CHUNK_SIZE]
+                mask = np.strings.find(self.search_blobs[chunk], self.search_text) >= 0
+                positions = chunk[mask]
+            if len(positions):
+                matches = [self.assets[i] for i in positions]
+                hits.append(positions)
+                filtered.extend(matches)
+                self.partial_ready.emit(matches)
+
+        if not self._stop_requested.is_set():
+            self.match_positions = np.concatenate(hits) if hits else np.empty(0, dtype=np.intp)
+            self.results_ready.emit(filtered)
 
-            batch = self.assets[i:i + batch_size]
-
-            for a in batch:
-                if self._stop_requested:
-                    return
-
-                asset_id = a['id']
-
-                # Fast path: check ID first
-                if self.search_text in asset_id.lower():
-                    filtered.append(a)
-                    continue
-
-                # Check type name
-                if self.search_text in a['type_name'].lower():
-                    filtered.append(a)
-                    continue
-
-                # Check resolved name if available
-                if asset_id in self.asset_info:
-                    name = self.asset_info[asset_id].get('resolved_name')
-                    if name and self.search_text in name.lower():
-                        filtered.append(a)
-                        continue
-
-                # Check other fields
-                url = a.get('url', '').lower()
-                hash_val = a.get('hash', '').lower()
-                cached_at = a.get('cached_at', '').lower()
-
-                if (self.search_text in url or
-                    self.search_text in hash_val or
-                    self.search_text in cached_at):
-                    filtered.append(a)
 
-        if not self._stop_requested:
-            self.results_ready.emit(filtered)
+_COOKIE_RE = re.compile(rb'\.ROBLOSECURITY\s+([^\s;]+)')
 
 
 def _get_roblosecurity() -> str | None:
     """Get .ROBLOSECURITY cookie from Roblox local storage."""
-    import os
-    import json
-    import base64
-    import re
-
-    try:
-        import win32crypt
-    except ImportError:
+    if win32crypt is None:
         return None
 
     path = os.path.expandvars(r'%LocalAppData%/Roblox/LocalStorage/RobloxCookies.dat')
@@ -111,15 +131,38 @@ def _get_roblosecurity() -> str | None:
             return None
         enc = base64.b64decode(cookies_data)
         dec = win32crypt.CryptUnprotectData(enc, None, None, None, 0)[1]
-        s = dec.decode(errors='ignore')
-        m = re.search(r'\.ROBLOSECURITY\s+([^\s;]+)', s)
-        return m.group(1) if m else None
+        # Match on the raw bytes so the whole blob is never decoded
+        m = _COOKIE_RE.search(dec)
+        return m.group(1).decode('ascii', errors='ignore') if m else None
     except Exception:
         return None
 
 
-class ImageLoaderThread(QThread):
-    """Worker thread for loading and processing images."""
+class NameResolverTask(QRunnable):
+    """Pooled job that resolves names for the currently visible assets."""
+
+    def __init__(self, resolve, asset_ids: list[str]):
+        super().__init__()
+        self._resolve = resolve
+        self.asset_ids = asset_ids
+
+    def run(self):
+        self._resolve(self.asset_ids)
+
+
+class PreviewLoaderTask(QRunnable):
+    """Pooled job running a preview loader's work off the GUI thread."""
+
+    def __init__(self, loader: QObject):
+        super().__init__()
+        self.loader = loader  # Keeps the loader (and its signals) alive while running
+
+    def run(self):
+        self.loader.run()
+
+
+class ImageLoader(QObject):
+    """Preview loader for decoding and processing images."""
 
     image_ready = pyqtSignal(QPixmap)
     error = pyqtSignal(str)
@@ -141,11 +184,16 @@ class ImageLoaderThread(QThread):
             if self._stop_requested:
                 return
 
-            # Convert to RGBA
-            if image.mode not in ('RGB', 'RGBA'):
-                image = image.convert('RGBA')
-            elif image.mode == 'RGB':
-                image = image.convert('RGBA')
+            # RGB and RGBA map directly onto QImage formats; only other
+            # modes (palette, L, CMYK, ...) need a conversion pass
+            if image.mode == 'RGB':
+                fmt = QImage.Format.Format_RGB888
+                bytes_per_pixel = 3
+            else:
+                if image.mode != 'RGBA':
+                    image = image.convert('RGBA')
+                fmt = QImage.Format.Format_RGBA8888
+                bytes_per_pixel = 4
 
             if self._stop_requested:
                 return
@@ -154,7 +202,8 @@ class ImageLoaderThread(QThread):
                 image.tobytes(),
                 image.width,
                 image.height,
-                QImage.Format.Format_RGBA8888
+                bytes_per_pixel * image.width,
+                fmt
             )
             pixmap = QPixmap.fromImage(qimage)
 
@@ -168,10 +217,10 @@ class ImageLoaderThread(QThread):
                 self.error.emit(str(e))
 
 
-class MeshLoaderThread(QThread):
-    """Worker thread for loading and converting meshes."""
+class MeshLoader(QObject):
+    """Preview loader for decompressing and converting meshes."""
 
-    mesh_ready = pyqtSignal(str)  # OBJ content
+    mesh_ready = pyqtSignal(object)  # mesh_processing.MeshData
     error = pyqtSignal(str)
 
     def __init__(self, data: bytes, asset_id: str):
@@ -196,17 +245,17 @@ class MeshLoaderThread(QThread):
             if self._stop_requested:
                 return
 
-            # Convert to OBJ
-            obj_content = mesh_processing.convert(decompressed)
+            # Decode to arrays; the viewer doesn't need OBJ text
+            mesh = mesh_processing.decode(decompressed)
 
             if self._stop_requested:
                 return
 
-            if obj_content:
-                log_buffer.log('Preview', f'Mesh converted successfully')
-                self.mesh_ready.emit(obj_content)
+            if mesh is not None:
+                log_buffer.log('Preview', f'Mesh decoded successfully')
+                self.mesh_ready.emit(mesh)
             else:
-                self.error.emit('Failed to convert mesh to OBJ format')
+                self.error.emit('Failed to decode mesh')
 
         except Exception as e:
             if not self._stop_requested:
@@ -214,10 +263,10 @@ class MeshLoaderThread(QThread):
                 self.error.emit(str(e))
 
 
-class AnimationLoaderThread(QThread):
-    """Worker thread for loading animation data asynchronously."""
+class AnimationLoader(QObject):
+    """Preview loader for decompressing animation data."""
 
-    animation_ready = pyqtSignal(bytes)  # Animation data ready to load into viewer
+    animation_ready = pyqtSignal(bytes)  # Decompressed animation data
     error = pyqtSignal(str)
 
     def __init__(self, data: bytes, asset_id: str):
@@ -250,10 +299,109 @@ class AnimationLoaderThread(QThread):
                 self.error.emit(str(e))
 
 
-class TexturePackLoaderThread(QThread):
-    """Worker thread for loading texture pack images asynchronously."""
+class AnimationTextLoader(QObject):
+    """Preview loader formatting an animation the viewer couldn't load as text."""
+
+    # Animation data plus its text preview ('' when the data is binary and
+    # should be hex dumped)
+    text_ready = pyqtSignal(bytes, str)
+
+    def __init__(self, data: bytes):
+        super().__init__()
+        self.data = data
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def run(self):
+        text = self._format_text(self.data)
+        if not self._stop_requested:
+            self.text_ready.emit(self.data, text)
+
+    @staticmethod
+    def _format_text(data: bytes) -> str:
+        """Get the text preview shown if the viewer can't load the animation."""
+        # Try to decode as XML for text display
+        text = data.decode('utf-8', errors='replace')
+
+        # Binary format, shown as hex
+        if not text.strip().startswith('<'):
+            return ''
 
-    texture_loaded = pyqtSignal(str, str, str, bytes)  # map_name, map_id, hash, image_data
+        # Format XML for display
+        import xml.etree.ElementTree as ET
+        try:
+            # Pretty print the parsed tree in place
+            root = ET.fromstring(data)
+            ET.indent(root, space='  ')
+            pretty_xml = ET.tostring(root, encoding='unicode')
+            # Remove extra blank lines
+            lines = (line for line in pretty_xml.split('\n') if line.strip())
+            return '\n'.join(itertools.islice(lines, 500))  # Limit lines
+        except Exception:
+            # Fallback to raw text
+            return f'Animation data\nSize: {_format_size(len(data))}\n\n{text[:5000]}'
+
+
+def _remove_temp_file(path: str):
+    """Delete a preview temp file, ignoring one that is already gone or in use."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class AudioFileWriter(QObject):
+    """Preview loader that writes audio data to a temp file for playback."""
+
+    file_ready = pyqtSignal(str)  # Path of the written file
+    error = pyqtSignal(str)
+
+    def __init__(self, data: bytes, asset_id: str):
+        super().__init__()
+        self.data = data
+        self.asset_id = asset_id
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def run(self):
+        import tempfile
+        from pathlib import Path
+
+        try:
+            # Create temporary file for audio
+            temp_dir = Path(tempfile.gettempdir()) / 'fleasion_audio'
+            temp_dir.mkdir(exist_ok=True)
+
+            # Each preview gets its own file (default to mp3), so overlapping
+            # previews of the same asset never share or replace one
+            fd, temp_file = tempfile.mkstemp(dir=temp_dir, prefix=f'{self.asset_id}_', suffix='.mp3')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self.data)
+            except BaseException:
+                _remove_temp_file(temp_file)
+                raise
+
+            if self._stop_requested:
+                _remove_temp_file(temp_file)
+            else:
+                self.file_ready.emit(temp_file)
+
+        except Exception as e:
+            if not self._stop_requested:
+                self.error.emit(str(e))
+
+
+class TexturePackLoader(QObject):
+    """Preview loader for fetching and decoding texture pack images."""
+
+    # map_name, map_id, hash, image_data, pixels, width, height, has_alpha
+    # (pixels are RGBA8888 when has_alpha, else RGB888)
+    texture_loaded = pyqtSignal(str, str, str, bytes, bytes, int, int, bool)
     texture_error = pyqtSignal(str, str)  # map_name, error_message
     finished_loading = pyqtSignal()
 
@@ -296,9 +444,17 @@ class TexturePackLoaderThread(QThread):
                         headers['Cookie'] = f'.ROBLOSECURITY={cookie};'
 
                     log_buffer.log('Preview', f'Fetching {map_name} from API')
-                    response = requests.get(api_url, headers=headers, timeout=10, allow_redirects=True)
-                    if response.status_code == 200 and response.content:
-                        data = response.content
+                    with requests.get(api_url, headers=headers, timeout=10, allow_redirects=True, stream=True) as response:
+                        # Stream the body into one growing buffer instead of
+                        # letting requests join the chunks into .content
+                        buf = bytearray()
+                        if response.status_code == 200:
+                            for chunk in response.iter_content(128 * 1024):
+                                if self._stop_requested:
+                                    return
+                                buf.extend(chunk)
+                    if response.status_code == 200 and buf:
+                        data = bytes(buf)
                         # Extract hash from final URL (after redirects)
                         final_url = response.url
                         parsed = urlparse(final_url)
@@ -314,7 +470,25 @@ class TexturePackLoaderThread(QThread):
                 if self._stop_requested:
                     return
 
-                self.texture_loaded.emit(map_name, str(map_id), hash_val, data)
+                # Decode here so the GUI thread only has to wrap the pixels.
+                # Fully opaque maps are packed as RGB, a quarter smaller than RGBA
+                image = Image.open(io.BytesIO(data))
+                has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+                if has_alpha:
+                    if image.mode != 'RGBA':
+                        image = image.convert('RGBA')
+                    if image.getchannel('A').getextrema()[0] == 255:
+                        has_alpha = False
+                if not has_alpha and image.mode != 'RGB':
+                    image = image.convert('RGB')
+
+                if self._stop_requested:
+                    return
+
+                self.texture_loaded.emit(
+                    map_name, str(map_id), hash_val, data, image.tobytes(), image.width, image.height,
+                    has_alpha
+                )
 
             except Exception as e:
                 if not self._stop_requested:
@@ -329,36 +503,108 @@ class TexturePackLoaderThread(QThread):
 class CacheViewerTab(QWidget):
     """Tab for viewing and managing cached Roblox assets."""
 
+    cache_changed = pyqtSignal()  # Re-emitted from CacheManager change callbacks (any thread)
+    names_resolved = pyqtSignal(list)  # [(asset_id, name), ...]
+
     def __init__(self, cache_manager: CacheManager, cache_scraper=None, parent=None, config_manager=None):
         super().__init__(parent)
         self.cache_manager = cache_manager
         self.cache_scraper = cache_scraper
         self.config_manager = config_manager
         self._last_asset_count = 0  # Track for change detection
+        self._assets_cache: tuple | None = None  # (filter_type, asset_count, assets)
+        self._last_search: tuple | None = None  # (assets, search_text, result positions)
+        self._current_visible_assets: list[dict] = []  # Assets currently shown in the table
         self._selected_asset_id: str | None = None  # Track selected asset by ID
         self._show_names = True  # Show names instead of hashes (on by default)
-        self._asset_info: dict[str, dict] = {}  # asset_id -> {resolved_name, hash, row}
+        # Per-asset metadata kept in parallel lists; _id_index maps asset_id -> slot
+        self._id_index: dict[str, int] = {}
+        self._hashes: list[str] = []
+        self._names: list[str | None] = []  # Resolved names
+        self._name_items: list[QTableWidgetItem | None] = []  # Name cells currently in the table
+        self._id_to_key: dict[str, str] = {}  # asset_id -> index key ({type}_{id})
+        self._pending_names: set[str] = set()  # asset_ids still without a resolved name
+        self._in_flight: set[str] = set()  # asset_ids in a batch already sent
+        self._pending_lock = threading.Lock()  # Guards _pending_names and _in_flight
         self._current_pixmap = None  # Store current image for resize
-
-        # Worker threads for async preview loading
-        self._image_loader: ImageLoaderThread | None = None
-        self._mesh_loader: MeshLoaderThread | None = None
-        self._animation_loader: AnimationLoaderThread | None = None
-        self._texturepack_loader: TexturePackLoaderThread | None = None
+        self._last_splitter_pos = 0
+        self._scale_pending = False  # A fast rescale is queued for the event loop
+        # (pixmap cacheKey, width, height, smooth) -> scaled pixmap, most recent last
+        self._scaled_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+        # Splitter drags show a fast rescale; the smooth one runs once they pause
+        self._smooth_timer = QTimer()
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self._apply_smooth_scale)
+        # Preview viewport size, kept current by eventFilter on resize
+        self._viewport_w = 0
+        self._viewport_h = 0
+
+        # Preview loaders run on a small pool; results are only applied while
+        # the preview token they were started under is still current
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(2)
+        self._preview_token = object()
+        self.destroyed.connect(lambda: setattr(self, '_preview_token', None))
+        self._image_loader: ImageLoader | None = None
+        self._mesh_loader: MeshLoader | None = None
+        self._animation_loader: AnimationLoader | AnimationTextLoader | None = None
+        self._texturepack_loader: TexturePackLoader | None = None
+        self._audio_writer: AudioFileWriter | None = None
 
         # Search worker thread
         self._search_worker: SearchWorkerThread | None = None
-        self._pending_search_text: str = ''
+        self._prior_workers: list[SearchWorkerThread] = []  # Cancelled workers still winding down
+        self._search_blobs: dict[str, tuple] = {}  # index key -> (cached_at, name, search text)
+        # (assets, search text array, asset id -> positions) for the current list
+        self._search_array: tuple | None = None
         self._is_searching: bool = False
+        self._search_rows_shown = False  # Current search has put rows in the table
 
         # Texturepack data for context menu
         self._texturepack_data: dict = {}  # map_name -> {id, hash, data}
         self._texturepack_xml: str = ''  # Original XML
 
+        # Name resolution runs as pooled jobs for the visible rows only. A
+        # single worker serializes API calls; stale queued jobs are dropped.
+        self._resolver_pool = QThreadPool(self)
+        self._resolver_pool.setMaxThreadCount(1)
+        self._resolver_wakeup = threading.Event()
+        self._resolver_stop = threading.Event()  # Set while the tab is hidden
+        self._resolve_debounce = QTimer()
+        self._resolve_debounce.setSingleShot(True)
+        self._resolve_debounce.timeout.connect(self._resolve_visible_names)
+        self.names_resolved.connect(self._apply_name_updates)
+        self._names_session = self._create_names_session()
+        self._cookie_cache: tuple[str | None, float] | None = None  # (cookie, read at)
+        self._names_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='NameFetch')
+        # The tab lives as long as the app (its window is only hidden when
+        # closed), so resolution pauses in hideEvent and the fetch pool and
+        # session are released on quit. Stop the resolver first so no job
+        # submits after the shutdown.
+        self.destroyed.connect(lambda: self._stop_name_resolution())
+        executor, session = self._names_executor, self._names_session
+        app = QApplication.instance()
+        app.aboutToQuit.connect(self._stop_name_resolution)
+        app.aboutToQuit.connect(lambda: executor.shutdown(wait=False, cancel_futures=True))
+        app.aboutToQuit.connect(session.close)
+        # Resolved names are written to index.json once 200 have piled up and
+        # at most every 10 s, plus whenever the tab is hidden or destroyed
+        self._resolved_since_save = 0
+        self._last_index_save = 0.0
+        self.destroyed.connect(lambda: self._flush_index())
+
         self._setup_ui()
-        self._refresh_timer = QTimer()
-        self._refresh_timer.timeout.connect(self._check_for_updates)
-        self._refresh_timer.start(3000)  # Check every 3 seconds
+        self.table.verticalScrollBar().valueChanged.connect(self._schedule_name_resolution)
+
+        # Refresh on cache mutations instead of polling; bursts of stores
+        # from the scraper are coalesced into a single update
+        self._update_coalesce = QTimer()
+        self._update_coalesce.setSingleShot(True)
+        self._update_coalesce.timeout.connect(self._check_for_updates)
+        self.cache_changed.connect(self._on_cache_changed)
+        callback = self.cache_changed.emit
+        cache_manager.add_change_callback(callback)
+        self.destroyed.connect(lambda: cache_manager.remove_change_callback(callback))
 
         # Search debounce timer (longer delay to batch rapid keystrokes)
         self._search_debounce = QTimer()
@@ -371,9 +617,6 @@ class CacheViewerTab(QWidget):
         # Refresh to show persisted names
         QTimer.singleShot(0, self._refresh_assets)
 
-        # Start name resolver daemon thread
-        threading.Thread(target=self._name_resolver_loop, daemon=True).start()
-
     def _setup_ui(self):
         """Setup the UI."""
         layout = QVBoxLayout()
@@ -498,6 +741,7 @@ class CacheViewerTab(QWidget):
         self.preview_scroll.setWidgetResizable(True)
         self.preview_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.preview_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.preview_scroll.viewport().installEventFilter(self)
 
         # Container widget inside scroll area
         self.preview_container = QWidget()
@@ -525,7 +769,7 @@ class CacheViewerTab(QWidget):
         self.preview_container_layout.addWidget(self.image_label)
 
         # Audio player container with centering wrapper
-        self.audio_player = None  # Created dynamically when needed
+        self.audio_player = None  # Created on first audio preview, then reused
         self.audio_wrapper = QWidget()
         audio_wrapper_layout = QVBoxLayout()
         audio_wrapper_layout.setContentsMargins(0, 0, 0, 0)
@@ -549,8 +793,9 @@ class CacheViewerTab(QWidget):
         self.text_viewer.setPlaceholderText('Select an asset to preview')
         self.preview_container_layout.addWidget(self.text_viewer)
 
-        # Texture pack container (dynamically created)
+        # Texture pack container, created on first use and then reused
         self.texturepack_widget = None
+        self._tp_rows: list[tuple[QLabel, QLabel]] = []
 
         # Set up scroll area
         self.preview_container.setLayout(self.preview_container_layout)
@@ -598,29 +843,55 @@ class CacheViewerTab(QWidget):
 
         parent_layout.addLayout(actions_layout)
 
+    def _on_cache_changed(self):
+        """Schedule a coalesced stats/table update after a cache mutation."""
+        self._assets_cache = None
+        if not self._update_coalesce.isActive():
+            # Without a search, new assets are cheaply appended; with one, the
+            # table is rebuilt, so don't do that more often than the 3 s poll did
+            self._update_coalesce.start(3000 if self.search_box.text().strip() else 500)
+
     def _check_for_updates(self):
         """Check if cache has new assets and update stats only."""
         try:
             stats = self.cache_manager.get_cache_stats()
             total_assets = stats['total_assets']
-            total_size = self._format_size(stats['total_size'])
+            total_size = _format_size(stats['total_size'])
             self.stats_label.setText(f'Total: {total_assets} assets | Size: {total_size}')
 
             # Only refresh table if asset count changed
             if total_assets != self._last_asset_count:
+                grew = total_assets > self._last_asset_count
                 self._last_asset_count = total_assets
-                self._refresh_assets()
+                self._assets_cache = None
+                if not (grew and self._append_new_assets()):
+                    self._refresh_assets()
         except Exception:
             pass  # Ignore errors during background refresh
 
+    def _append_new_assets(self) -> bool:
+        """Add newly cached assets to the table without rebuilding it.
+
+        Only possible while no search is shown, so the table holds the whole
+        list for the current filter. Returns False when a full refresh is needed.
+        """
+        if self.search_box.text().strip():
+            return False
+        assets = self._get_assets(self.type_filter.currentData())
+        shown = {(asset['type'], asset['id']) for asset in self._current_visible_assets}
+        new_assets = [asset for asset in assets if (asset['type'], asset['id']) not in shown]
+        # Assets removed meanwhile need their rows dropped as well
+        if len(shown) + len(new_assets) != len(assets):
+            return False
+        if new_assets:
+            # The table keeps itself sorted, so appended rows land in place
+            self._append_table_rows(new_assets)
+        return True
+
     def _refresh_assets(self):
         '''Refresh the asset list using search worker for all searches.'''
         # Stop any existing search
-        if self._search_worker is not None:
-            self._search_worker.stop()
-            self._search_worker.quit()
-            self._search_worker.wait()
-            self._search_worker = None
+        self._cancel_search()
 
         # Get search text
         search_text = self.search_box.text().strip()
@@ -634,7 +905,7 @@ class CacheViewerTab(QWidget):
         filter_type = self.type_filter.currentData()
 
         # Get assets
-        assets = self.cache_manager.list_assets(filter_type)
+        assets = self._get_assets(filter_type)
 
         # For empty search, show all immediately
         if not search_text:
@@ -642,14 +913,114 @@ class CacheViewerTab(QWidget):
             return
 
         # Always use worker thread for searches to prevent UI freezing
-        self._is_searching = True
-        self._search_worker = SearchWorkerThread(assets, search_text, self._asset_info)
-        self._search_worker.results_ready.connect(self._on_search_complete)
-        self._search_worker.finished.connect(self._on_search_finished)
-        self._search_worker.start()
+        self._start_search(assets, search_text)
+
+    def _search_candidates(self, assets: list, search_text: str) -> np.ndarray | None:
+        """Return the positions in assets a search must scan, or None for all.
+
+        When the query extends the previous one over the same asset list, only
+        the previous matches can still match, so those are scanned instead.
+        """
+        last = self._last_search
+        if last is not None and last[0] is assets and search_text.startswith(last[1]):
+            return last[2]
+        return None
+
+    def _search_array_for(self, assets: list) -> np.ndarray:
+        """Get the search text array for an asset list, built once per list."""
+        cached = self._search_array
+        if cached is not None and cached[0] is assets:
+            return cached[1]
+        # Variable-width strings: a fixed-width array would pad every entry
+        # to the longest URL or name
+        blobs = np.array([self._search_blob(a) for a in assets], dtype=np.dtypes.StringDType())
+        positions: dict[str, list[int]] = {}
+        for i, asset in enumerate(assets):
+            positions.setdefault(asset['id'], []).append(i)
+        self._search_array = (assets, blobs, positions)
+        return blobs
+
+    def _update_search_array(self, asset_ids):
+        """Refresh the search text of assets whose names changed, in place."""
+        if self._search_array is None:
+            return
+        assets, blobs, positions = self._search_array
+        for asset_id in asset_ids:
+            for i in positions.get(asset_id, ()):
+                blobs[i] = self._search_blob(assets[i])
+
+    def _get_assets(self, filter_type) -> list:
+        """Get the asset list, reusing the last result while the cache is unchanged."""
+        key = (filter_type, self._last_asset_count)
+        if self._assets_cache is not None and self._assets_cache[:2] == key:
+            return self._assets_cache[2]
+
+        assets = self.cache_manager.list_assets(filter_type)
+        self._assets_cache = (*key, assets)
+        return assets
+
+    def _search_blob(self, asset: dict) -> str:
+        """Get an asset's lowercased searchable fields joined into one string.
+
+        Fields are separated by a unit separator so a query can't match across them.
+        """
+        key = f"{asset['type']}_{asset['id']}"
+        cached_at = asset.get('cached_at', '')
+        name = self._resolved_name(asset['id'])
+
+        # Rebuilt only when the asset is re-stored or its name resolves
+        entry = self._search_blobs.get(key)
+        if entry is None or entry[0] != cached_at or entry[1] != name:
+            fields = [asset['id'], asset['type_name'], asset.get('url', ''), asset.get('hash', ''), cached_at]
+            if name:
+                fields.append(name)
+            entry = (cached_at, name, '\x1f'.join(fields).lower())
+            self._search_blobs[key] = entry
+        return entry[2]
+
+    def _add_asset_slot(self, asset_id: str, hash_val: str, resolved_name: str | None = None) -> int:
+        """Append a metadata slot for an asset and return its index."""
+        slot = len(self._hashes)
+        self._hashes.append(hash_val)
+        self._names.append(resolved_name)
+        self._name_items.append(None)
+        # Published last so the resolver thread never sees a partial slot
+        self._id_index[asset_id] = slot
+        return slot
+
+    def _resolved_name(self, asset_id: str) -> str | None:
+        """Get the resolved name for an asset, if any."""
+        slot = self._id_index.get(asset_id)
+        return self._names[slot] if slot is not None else None
 
     def _populate_table(self, assets: list):
         """Populate the table with assets."""
+        # Drop name-cell references for the rows about to be replaced
+        for asset in self._current_visible_assets:
+            slot = self._id_index.get(asset['id'])
+            if slot is not None:
+                self._name_items[slot] = None
+        self._current_visible_assets = assets
+        self._fill_table_rows(assets, 0)
+
+        # Update stats
+        try:
+            stats = self.cache_manager.get_cache_stats()
+            total_assets = stats['total_assets']
+            total_size = _format_size(stats['total_size'])
+            self.stats_label.setText(f'Total: {total_assets} assets | Size: {total_size}')
+            self._last_asset_count = total_assets
+        except Exception:
+            pass
+
+    def _append_table_rows(self, assets: list):
+        """Append assets below the rows already in the table."""
+        start_row = self.table.rowCount()
+        self._current_visible_assets.extend(assets)
+        self._fill_table_rows(assets, start_row)
+
+    def _fill_table_rows(self, assets: list, start_row: int):
+        """Write assets into the table starting at start_row."""
         # Disable updates while populating (major performance boost)
         self.table.setUpdatesEnabled(False)
         self.table.setSortingEnabled(False)
@@ -659,9 +1030,9 @@ class CacheViewerTab(QWidget):
 
         try:
             # Update table
-            self.table.setRowCount(len(assets))
+            self.table.setRowCount(start_row + len(assets))
 
-            for row, asset in enumerate(assets):
+            for row, asset in enumerate(assets, start_row):
                 asset_id = asset['id']
                 hash_val = asset.get('hash', '')
 
@@ -669,25 +1040,25 @@ class CacheViewerTab(QWidget):
                 if self._selected_asset_id and asset_id == self._selected_asset_id:
                     row_to_select = row
 
-                # Initialize or update asset info tracking
-                if asset_id not in self._asset_info:
-                    self._asset_info[asset_id] = {
-                        'hash': hash_val,
-                        'resolved_name': None,
-                        'row': row,
-                    }
-                else:
-                    self._asset_info[asset_id]['row'] = row
+                # Initialize asset info tracking
+                slot = self._id_index.get(asset_id)
+                if slot is None:
+                    slot = self._add_asset_slot(asset_id, hash_val)
+                    with self._pending_lock:
+                        self._pending_names.add(asset_id)
+                if asset_id not in self._id_to_key:
+                    self._id_to_key[asset_id] = f"{asset['type']}_{asset_id}"
 
                 # Hash/Name (column 0) - show resolved name or hash based on toggle
-                info = self._asset_info[asset_id]
-                if self._show_names and info.get('resolved_name'):
-                    display_val = info['resolved_name']
+                resolved_name = self._names[slot]
+                if self._show_names and resolved_name:
+                    display_val = resolved_name
                 else:
                     display_val = hash_val
                 name_item = QTableWidgetItem(display_val)
                 name_item.setData(Qt.ItemDataRole.UserRole, asset)
                 self.table.setItem(row, 0, name_item)
+                self._name_items[slot] = name_item  # Follows the row through sorting
 
                 # Asset ID (column 1)
                 id_item = QTableWidgetItem(asset_id)
@@ -699,7 +1070,7 @@ class CacheViewerTab(QWidget):
 
                 # Size (column 3)
                 size = asset.get('size', 0)
-                size_str = self._format_size(size)
+                size_str = _format_size(size)
                 size_item = QTableWidgetItem(size_str)
                 self.table.setItem(row, 3, size_item)
 
@@ -729,23 +1100,7 @@ class CacheViewerTab(QWidget):
             self.table.selectRow(row_to_select)
             self.table.blockSignals(False)
 
-        # Update stats
-        try:
-            stats = self.cache_manager.get_cache_stats()
-            total_assets = stats['total_assets']
-            total_size = self._format_size(stats['total_size'])
-            self.stats_label.setText(f'Total: {total_assets} assets | Size: {total_size}')
-            self._last_asset_count = total_assets
-        except Exception:
-            pass
-
-    def _format_size(self, size_bytes: int) -> str:
-        """Format size in bytes to human-readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f'{size_bytes:.1f} {unit}'
-            size_bytes /= 1024.0
-        return f'{size_bytes:.1f} TB'
+        self._schedule_name_resolution()
 
     def _toggle_scraper(self, state):
         """Toggle cache scraper on/off."""
@@ -754,18 +1109,18 @@ class CacheViewerTab(QWidget):
             self.cache_scraper.set_enabled(enabled)
 
     def _on_search_text_changed(self):
-        '''Handle search text change - debounce to avoid too many searches.'''
-        self._search_debounce.stop()
-        self._search_debounce.start(300)  # 300ms debounce
+        '''Handle search text change - throttle to avoid too many searches.'''
+        # The first keystroke searches almost immediately; keystrokes arriving
+        # while a search is still pending push it back to batch rapid typing
+        if self._search_debounce.isActive():
+            self._search_debounce.start(300)
+        else:
+            self._search_debounce.start(50)
 
     def _do_search(self):
         '''Execute the actual search after debounce using worker thread.'''
         # Stop any existing search
-        if self._search_worker is not None:
-            self._search_worker.stop()
-            self._search_worker.quit()
-            self._search_worker.wait()
-            self._search_worker = None
+        self._cancel_search()
 
         search_text = self.search_box.text().strip()
 
@@ -776,7 +1131,7 @@ class CacheViewerTab(QWidget):
 
         # Get filter type and assets
         filter_type = self.type_filter.currentData()
-        assets = self.cache_manager.list_assets(filter_type)
+        assets = self._get_assets(filter_type)
 
         # For empty search, show all immediately
         if not search_text:
@@ -784,130 +1139,177 @@ class CacheViewerTab(QWidget):
             return
 
         # Always use worker thread to prevent UI freezing
+        self._start_search(assets, search_text)
+
+    def _start_search(self, assets: list, search_text: str):
+        '''Start a search worker; results from superseded workers are dropped.'''
         self._is_searching = True
-        self._search_worker = SearchWorkerThread(assets, search_text, self._asset_info)
-        self._search_worker.results_ready.connect(self._on_search_complete)
-        self._search_worker.finished.connect(self._on_search_finished)
-        self._search_worker.start()
+        self._search_rows_shown = False
+        candidates = self._search_candidates(assets, search_text)
+        worker = SearchWorkerThread(assets, search_text, self._search_array_for(assets), candidates)
+        worker.partial_ready.connect(
+            lambda matches, w=worker: self._on_search_partial(matches)
+            if w is self._search_worker else None
+        )
+        worker.results_ready.connect(
+            lambda results, w=worker: self._on_search_complete(
+                assets, search_text, results, w.match_positions
+            )
+            if w is self._search_worker else None
+        )
+        worker.finished.connect(lambda w=worker: self._on_search_finished(w))
+        self._search_worker = worker
+        worker.start()
+
+    def _cancel_search(self):
+        '''Signal the running search worker to stop without blocking the UI thread.'''
+        if self._search_worker is not None:
+            self._search_worker.stop()
+            # Keep a reference until the thread exits on its own; a worker that
+            # already finished won't emit finished again to remove it
+            if not self._search_worker.isFinished():
+                self._prior_workers.append(self._search_worker)
+            self._search_worker = None
+            self._is_searching = False
+
+    def _on_search_partial(self, matches: list):
+        '''Show a chunk of matches as soon as the worker finds them.'''
+        if self._search_rows_shown:
+            self._append_table_rows(matches)
+        else:
+            # First chunk replaces the previous results
+            self._search_rows_shown = True
+            self._populate_table(matches)
 
-    def _on_search_complete(self, filtered_assets: list):
+    def _on_search_complete(self, assets: list, search_text: str, filtered_assets: list,
+                            positions: np.ndarray):
         '''Handle search results from worker thread.'''
-        self._populate_table(filtered_assets)
+        self._last_search = (assets, search_text, positions)
+        # Rows already arrived through partial_ready; only clear on no matches
+        if not self._search_rows_shown:
+            self._populate_table(filtered_assets)
 
-    def _on_search_finished(self):
+    def _on_search_finished(self, worker: SearchWorkerThread):
         '''Handle search worker thread finished.'''
-        self._is_searching = False
+        if worker is self._search_worker:
+            self._search_worker = None
+            self._is_searching = False
+        elif worker in self._prior_workers:
+            self._prior_workers.remove(worker)
+        worker.deleteLater()
 
     def _load_persisted_names(self):
         """Load persisted resolved names from index.json."""
+        id_index = self._id_index
+        names = self._names
+        id_to_key = self._id_to_key
         for asset_key, asset_data in self.cache_manager.index['assets'].items():
             asset_id = asset_data['id']
+            id_to_key.setdefault(asset_id, asset_key)
             resolved_name = asset_data.get('resolved_name')
-            if resolved_name:
-                if asset_id not in self._asset_info:
-                    self._asset_info[asset_id] = {
-                        'hash': asset_data.get('hash', ''),
-                        'resolved_name': resolved_name,
-                        'row': None,
-                    }
-                else:
-                    self._asset_info[asset_id]['resolved_name'] = resolved_name
+            if not resolved_name:
+                continue
+            slot = id_index.get(asset_id)
+            if slot is None:
+                self._add_asset_slot(asset_id, asset_data.get('hash', ''), resolved_name)
+            else:
+                names[slot] = resolved_name
 
     def _on_show_names_toggled(self, checked: bool):
         """Handle Show Names toggle."""
         self._show_names = checked
+        if checked:
+            self._schedule_name_resolution()
 
         # Disable updates for performance
         self.table.setUpdatesEnabled(False)
         try:
             # Update all rows to show either resolved name or hash
-            for asset_id, info in self._asset_info.items():
-                row = info.get('row')
-                if row is None:
-                    continue
-                if row >= self.table.rowCount():
+            for item, resolved_name, hash_val in zip(self._name_items, self._names, self._hashes):
+                if item is None:
                     continue
 
-                if checked and info.get('resolved_name'):
-                    display_val = info['resolved_name']
+                if checked and resolved_name:
+                    display_val = resolved_name
                 else:
-                    display_val = info.get('hash', '')
+                    display_val = hash_val
 
-                item = self.table.item(row, 0)
-                if item:
-                    item.setText(display_val)
+                item.setText(display_val)
         finally:
             # Re-enable updates
             self.table.setUpdatesEnabled(True)
 
-    def _update_row_name(self, asset_id: str, name: str):
-        """Update a single row's name cell (thread-safe via QTimer)."""
-        info = self._asset_info.get(asset_id)
-        if not info:
-            return
-        row = info.get('row')
-        if row is None or row >= self.table.rowCount():
+    def _apply_name_updates(self, names: list[tuple[str, str]]):
+        """Record a batch of fetched names in memory, the index and the table (main thread)."""
+        updates = []
+        for asset_id, name in names:
+            # The cache may have been cleared since the batch was fetched
+            slot = self._id_index.get(asset_id)
+            if slot is None:
+                continue
+
+            # Store resolved name in memory
+            self._names[slot] = name
+            with self._pending_lock:
+                self._pending_names.discard(asset_id)
+
+            # Save to index.json for persistence
+            self._save_resolved_name_to_index(asset_id, name)
+
+            updates.append((asset_id, name))
+
+        if not updates:
             return
-        # Only update if Show Names is enabled
+
+        # New names can match queries that previously excluded these assets
+        self._last_search = None
+        self._update_search_array(asset_id for asset_id, _ in updates)
+
+        # Only update cells if Show Names is enabled
         if self._show_names:
-            item = self.table.item(row, 0)
-            if item:
-                item.setText(name)
+            self.table.setUpdatesEnabled(False)
+            try:
+                for asset_id, name in updates:
+                    item = self._name_items[self._id_index[asset_id]]
+                    if item is not None:
+                        item.setText(name)
+            finally:
+                self.table.setUpdatesEnabled(True)
+
+        # Save index after batch update (throttled)
+        self._resolved_since_save += len(updates)
+        if (self._resolved_since_save >= 200
+                and time.monotonic() - self._last_index_save > 10.0):
+            self._flush_index()
 
     def _save_resolved_name_to_index(self, asset_id: str, name: str):
         """Save resolved name to index.json for persistence."""
-        # Find the asset key in index (format: {type}_{id})
-        # Use list() to get a snapshot of keys to avoid dictionary changed during iteration
-        asset_keys = list(self.cache_manager.index['assets'].keys())
-        for asset_key in asset_keys:
-            # Check if key still exists (in case it was deleted)
-            if asset_key not in self.cache_manager.index['assets']:
-                continue
-            asset_data = self.cache_manager.index['assets'][asset_key]
-            if asset_data['id'] == asset_id:
-                # Update the resolved_name field
-                asset_data['resolved_name'] = name
-                # Don't save on every update - too slow
-                # Let periodic saves or user actions handle persistence
-                break
+        # Look up the asset key in index (format: {type}_{id})
+        asset_key = self._id_to_key.get(asset_id)
+        if asset_key is None:
+            return
+        # The asset may have been deleted since it was tracked
+        asset_data = self.cache_manager.index['assets'].get(asset_key)
+        if asset_data is not None:
+            # Update the resolved_name field
+            asset_data['resolved_name'] = name
+            # Don't save on every update - too slow
+            # Let periodic saves or user actions handle persistence
 
     def _get_roblosecurity(self) -> str | None:
-        """Get .ROBLOSECURITY cookie from Roblox local storage."""
-        import os
-        import json
-        import base64
-        import re
-
-        try:
-            import win32crypt
-        except ImportError:
-            return None
-
-        path = os.path.expandvars(r'%LocalAppData%/Roblox/LocalStorage/RobloxCookies.dat')
-        try:
-            if not os.path.exists(path):
-                return None
-            with open(path, 'r') as f:
-                data = json.load(f)
-            cookies_data = data.get('CookiesData')
-            if not cookies_data:
-                return None
-            enc = base64.b64decode(cookies_data)
-            dec = win32crypt.CryptUnprotectData(enc, None, None, None, 0)[1]
-            s = dec.decode(errors='ignore')
-            m = re.search(r'\.ROBLOSECURITY\s+([^\s;]+)', s)
-            return m.group(1) if m else None
-        except Exception:
-            return None
-
-    def _fetch_asset_names(self, asset_ids: list[str], cookie: str | None) -> dict[str, str] | None:
-        """Fetch asset names from Roblox Develop API (batch up to 50)."""
+        """Get .ROBLOSECURITY cookie, re-reading it from disk at most once a minute."""
+        now = time.monotonic()
+        if self._cookie_cache is not None and now - self._cookie_cache[1] < 60:
+            return self._cookie_cache[0]
+        cookie = _get_roblosecurity()
+        self._cookie_cache = (cookie, now)
+        return cookie
+
+    def _create_names_session(self):
+        """Create the pooled session used for name lookups (kept for the tab's lifetime)."""
         import requests
+        from urllib3.util import Retry
 
-        if not asset_ids:
-            return None
-
-        # Build session with auth
         sess = requests.Session()
         sess.trust_env = False
         sess.proxies = {}
@@ -918,15 +1320,33 @@ class CacheViewerTab(QWidget):
             'Referer': 'https://www.roblox.com/',
             'Origin': 'https://www.roblox.com',
         })
-        if cookie:
-            sess.headers['Cookie'] = f'.ROBLOSECURITY={cookie};'
+        # Keep the TLS connection to develop.roblox.com alive across batches
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        sess.mount('https://', adapter)
+        return sess
+
+    def _fetch_asset_names(self, asset_ids: list[str], cookie: str | None) -> dict[str, str] | None:
+        """Fetch asset names from Roblox Develop API (batch up to 50)."""
+        if not asset_ids:
+            return None
+
+        # Reuse the persistent session; the auth cookie goes per call since
+        # several batches may be in flight at once
+        headers = {'Cookie': f'.ROBLOSECURITY={cookie};'} if cookie else None
 
         # Build query: assetIds=123,456,789
         query = ','.join(str(aid) for aid in asset_ids)
         url = f'https://develop.roblox.com/v1/assets?assetIds={query}'
 
         try:
-            response = sess.get(url, timeout=10)
+            response = self._names_session.get(url, headers=headers, timeout=10)
+            if response.status_code in (401, 403):
+                # Cookie likely rotated; decrypt it again on the next batch
+                self._cookie_cache = None
             response.raise_for_status()
         except Exception as e:
             log_buffer.log('Cache', f'[Name Resolver] Failed to fetch names: {e}')
@@ -942,76 +1362,175 @@ class CacheViewerTab(QWidget):
 
         return result
 
-    def _name_resolver_loop(self):
-        """Background thread to resolve asset names."""
-        import time
+    def _schedule_name_resolution(self, *_):
+        """Debounce name resolution while the table is being scrolled."""
+        if self._show_names:
+            self._resolve_debounce.start(250)
+
+    def _visible_asset_ids(self) -> list[str]:
+        """Get asset IDs for the rows currently visible in the table viewport."""
+        row_count = self.table.rowCount()
+        if row_count == 0:
+            return []
+        first = self.table.rowAt(0)
+        last = self.table.rowAt(self.table.viewport().height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = row_count - 1
 
-        while True:
-            # Skip if Show Names is OFF
-            if not self._show_names:
-                time.sleep(0.2)
-                continue
+        asset_ids = []
+        for row in range(first, last + 1):
+            id_item = self.table.item(row, 1)
+            if id_item:
+                asset_ids.append(id_item.text())
+        return asset_ids
 
-            # Get authentication cookie
-            cookie = self._get_roblosecurity()
-            if not cookie:
-                # No cookie - wait longer to avoid spam
-                time.sleep(5)
-                continue
+    def _resolve_visible_names(self):
+        """Submit a pooled job resolving names for visible rows without one."""
+        if not self._show_names:
+            return
 
-            # Build pending list - assets without resolved names
+        visible = self._visible_asset_ids()
+        with self._pending_lock:
             pending = [
-                asset_id
-                for asset_id, info in self._asset_info.items()
-                if info.get('resolved_name') is None and info.get('row') is not None
+                asset_id for asset_id in visible
+                if asset_id in self._pending_names and asset_id not in self._in_flight
             ]
 
-            if not pending:
-                time.sleep(0.2)
-                continue
+        if not pending:
+            return
 
-            # Batch size and delay
-            batch_size = 50
-            delay = 0.2 if len(pending) > 50 else 0.5
+        # Only the latest visible range matters; drop jobs that haven't started
+        # and wake a running job out of its between-batch wait so it yields
+        self._resolver_pool.clear()
+        self._resolver_wakeup.set()
+        self._resolver_pool.start(NameResolverTask(self._resolve_names, pending))
 
-            # Take the first batch
-            batch = pending[:batch_size]
+    def _resolve_names(self, asset_ids: list[str]):
+        """Resolve names for the given assets (runs on the resolver pool)."""
+        if self._resolver_stop.is_set():
+            return
+        # The pool runs one job at a time, so any wakeup set so far was for us
+        self._resolver_wakeup.clear()
 
-            # Fetch names
-            try:
-                names = self._fetch_asset_names(batch, cookie)
-            except Exception as e:
-                log_buffer.log('Cache', f'[Name Resolver] Fetch failed: {e}')
-                time.sleep(delay)
-                continue
+        # Get authentication cookie
+        cookie = self._get_roblosecurity()
+        if not cookie:
+            return
 
-            if not names:
-                time.sleep(delay)
-                continue
+        # The API takes up to 50 ids per call; keep up to four calls in flight
+        # over the pooled session, whose retry policy backs off on 429s
+        batch_size = 50
+        max_in_flight = 4
 
-            # Update cache and UI
-            for asset_id, name in names.items():
-                info = self._asset_info.get(asset_id)
-                if not info:
+        batches = iter([asset_ids[i:i + batch_size] for i in range(0, len(asset_ids), batch_size)])
+        in_flight = deque()
+        for batch in itertools.islice(batches, max_in_flight):
+            future = self._submit_name_fetch(batch, cookie)
+            if future is None:
+                return
+            in_flight.append((batch, future))
+        while in_flight:
+            batch, future = in_flight.popleft()
+            # Wait in short slices so teardown isn't held up by slow or
+            # retrying calls; their results are simply dropped
+            while True:
+                if self._resolver_stop.is_set():
+                    future.cancel()
+                    for _, pending in in_flight:
+                        pending.cancel()
+                    # Unanswered ids are asked for again once resolution resumes
+                    with self._pending_lock:
+                        self._in_flight.difference_update(batch)
+                        for pending_batch, _ in in_flight:
+                            self._in_flight.difference_update(pending_batch)
+                    return
+                try:
+                    names = future.result(timeout=0.25)
+                except TimeoutError:
                     continue
+                except Exception as e:
+                    log_buffer.log('Cache', f'[Name Resolver] Fetch failed: {e}')
+                    names = None
+                break
 
-                # Store resolved name in memory
-                info['resolved_name'] = name
+            # A newer job wakes us to give way; calls already sent are still applied
+            if not self._resolver_wakeup.is_set():
+                next_batch = next(batches, None)
+                if next_batch is not None:
+                    next_future = self._submit_name_fetch(next_batch, cookie)
+                    if next_future is not None:
+                        in_flight.append((next_batch, next_future))
+
+            if names:
+                # Slots are only touched on the GUI thread, where clears happen
+                self.names_resolved.emit(list(names.items()))
+            with self._pending_lock:
+                self._in_flight.difference_update(batch)
+                if names is not None:
+                    # Ids the API answered without are deleted or private;
+                    # drop them from pending so they aren't asked for again
+                    self._pending_names.difference_update(batch)
+
+    def _submit_name_fetch(self, batch: list[str], cookie: str):
+        """Mark a batch as in flight and fetch its names on the executor.
+
+        Returns None once name resolution has been stopped.
+        """
+        if self._resolver_stop.is_set():
+            return None
+        with self._pending_lock:
+            self._in_flight.update(batch)
+        try:
+            return self._names_executor.submit(self._fetch_asset_names, batch, cookie)
+        except RuntimeError:
+            # The executor shut down between the stop check and the submit
+            with self._pending_lock:
+                self._in_flight.difference_update(batch)
+            return None
 
-                # Save to index.json for persistence
-                self._save_resolved_name_to_index(asset_id, name)
+    def _stop_name_resolution(self):
+        """Stop name resolution until the tab is shown again.
 
-                # Update UI on main thread
-                if self._show_names:
-                    QTimer.singleShot(0, lambda aid=asset_id, n=name: self._update_row_name(aid, n))
+        A running job stops waiting on its in-flight calls within a quarter
+        second and submits no more; calls already sent finish on the executor
+        and are discarded.
+        """
+        self._resolver_stop.set()
+        self._resolver_pool.clear()
+        self._resolver_wakeup.set()
 
-            # Save index after batch update (less frequent saves)
-            try:
-                self.cache_manager._save_index()
-            except Exception as e:
-                log_buffer.log('Cache', f'[Name Resolver] Failed to save index: {e}')
-
-            time.sleep(delay)
+    def _flush_index(self):
+        """Write the index to disk if resolved names are pending."""
+        if not self._resolved_since_save:
+            return
+        self._resolved_since_save = 0
+        self._last_index_save = time.monotonic()
+        try:
+            self.cache_manager._save_index()
+        except Exception as e:
+            log_buffer.log('Cache', f'[Name Resolver] Failed to save index: {e}')
+
+    def eventFilter(self, obj, event):
+        """Track the preview viewport size so scaling doesn't query it each time."""
+        if event.type() == QEvent.Type.Resize and obj is self.preview_scroll.viewport():
+            size = event.size()
+            self._viewport_w = size.width()
+            self._viewport_h = size.height()
+        return super().eventFilter(obj, event)
+
+    def hideEvent(self, event):
+        """Pause name resolution and flush pending name updates when hidden."""
+        super().hideEvent(event)
+        self._stop_name_resolution()
+        self._flush_index()
+
+    def showEvent(self, event):
+        """Resume name resolution for the visible rows when shown again."""
+        super().showEvent(event)
+        self._resolver_stop.clear()
+        self._schedule_name_resolution()
 
     def _get_selected_asset(self) -> dict | None:
         """Get the currently selected asset."""
@@ -1059,36 +1578,8 @@ class CacheViewerTab(QWidget):
 
     def _export_all(self):
         """Export all visible assets."""
-        # Get current filter
-        filter_type = self.type_filter.currentData()
-        assets = self.cache_manager.list_assets(filter_type)
-
-        # Apply search filter across all columns (same as _refresh_assets)
-        search_text = self.search_box.text().strip().lower()
-        if search_text:
-            filtered = []
-            for a in assets:
-                asset_id = a['id'].lower()
-                type_name = a['type_name'].lower()
-                url = a.get('url', '').lower()
-                hash_val = a.get('hash', '').lower()
-                size_str = self._format_size(a.get('size', 0)).lower()
-                cached_at = a.get('cached_at', '').lower()
-
-                resolved_name = ''
-                if asset_id in self._asset_info:
-                    name = self._asset_info[asset_id].get('resolved_name')
-                    resolved_name = name.lower() if name else ''
-
-                if (search_text in asset_id or
-                    search_text in type_name or
-                    search_text in url or
-                    search_text in hash_val or
-                    search_text in resolved_name or
-                    search_text in size_str or
-                    search_text in cached_at):
-                    filtered.append(a)
-            assets = filtered
+        # The table already reflects the current filter and search
+        assets = list(self._current_visible_assets)
 
         if not assets:
             QMessageBox.warning(self, 'No Assets', 'No assets to export')
@@ -1108,9 +1599,7 @@ class CacheViewerTab(QWidget):
         for asset in assets:
             asset_id = asset['id']
             # Get resolved name if available
-            resolved_name = None
-            if asset_id in self._asset_info:
-                resolved_name = self._asset_info[asset_id].get('resolved_name')
+            resolved_name = self._resolved_name(asset_id)
 
             if self.cache_manager.export_asset(asset['id'], asset['type'], resolved_name=resolved_name):
                 exported_count += 1
@@ -1155,6 +1644,9 @@ class CacheViewerTab(QWidget):
             deleted_count = 0
             for asset in assets_to_delete:
                 if self.cache_manager.delete_asset(asset['id'], asset['type']):
+                    self._id_to_key.pop(asset['id'], None)
+                    with self._pending_lock:
+                        self._pending_names.discard(asset['id'])
                     deleted_count += 1
                     log_buffer.log('Cache', f"Deleted asset {asset['id']}")
 
@@ -1189,7 +1681,16 @@ class CacheViewerTab(QWidget):
                 self.cache_manager.index = {'assets': {}}
                 self.cache_manager._save_index()
                 self._last_asset_count = 0
-                self._asset_info.clear()
+                self._assets_cache = None
+                self._id_index.clear()
+                self._hashes.clear()
+                self._names.clear()
+                self._name_items.clear()
+                self._id_to_key.clear()
+                self._search_blobs.clear()
+                self._search_array = None
+                with self._pending_lock:
+                    self._pending_names.clear()
                 # Clear scraper tracking so assets can be re-scraped
                 if self.cache_scraper:
                     self.cache_scraper.clear_tracking()
@@ -1228,16 +1729,13 @@ class CacheViewerTab(QWidget):
         self.animation_viewer.hide()
         self.text_viewer.hide()
 
-        # Clean up texture pack widget
+        # Texture pack rows are kept for the next texture pack preview
         if self.texturepack_widget is not None:
-            self.texturepack_widget.deleteLater()
-            self.texturepack_widget = None
+            self.texturepack_widget.hide()
 
-        # Stop any playing audio
+        # Stop any playing audio and release it; an audio preview reloads it
         if self.audio_player:
-            self.audio_player.stop()
-            self.audio_player.deleteLater()
-            self.audio_player = None
+            self.audio_player.unload()
 
         # Stop animation playback
         self.animation_viewer.stop()
@@ -1410,9 +1908,7 @@ class CacheViewerTab(QWidget):
         asset_type = asset['type']
 
         # Get resolved name if available
-        resolved_name = None
-        if asset_id in self._asset_info:
-            resolved_name = self._asset_info[asset_id].get('resolved_name')
+        resolved_name = self._resolved_name(asset_id)
 
         try:
             # Get asset data
@@ -1527,9 +2023,7 @@ class CacheViewerTab(QWidget):
         for asset in assets_to_export:
             asset_id = asset['id']
             # Get resolved name if available
-            resolved_name = None
-            if asset_id in self._asset_info:
-                resolved_name = self._asset_info[asset_id].get('resolved_name')
+            resolved_name = self._resolved_name(asset_id)
 
             if self.cache_manager.export_asset(
                 asset['id'], asset['type'],
@@ -1563,29 +2057,35 @@ class CacheViewerTab(QWidget):
         if not asset_ids:
             return
 
-        # Try to find the replacer entry field (walk up parent chain)
-        replacer_window = None
-        widget = self
-        while widget is not None:
-            if hasattr(widget, 'replace_entry'):
-                replacer_window = widget
-                break
-            widget = widget.parent() if hasattr(widget, 'parent') else None
+        # Try to find the replacer entry field; it lives on the top-level
+        # window, so check that first and only walk the parent chain if not
+        replacer_window = self.window()
+        if not hasattr(replacer_window, 'replace_entry'):
+            replacer_window = None
+            widget = self.parent()
+            while widget is not None:
+                if hasattr(widget, 'replace_entry'):
+                    replacer_window = widget
+                    break
+                widget = widget.parent()
 
         if replacer_window:
-            # Add to existing IDs if there are any
-            current_text = replacer_window.replace_entry.text().strip()
-            if current_text:
-                new_text = current_text + ', ' + ', '.join(asset_ids)
-            else:
-                new_text = ', '.join(asset_ids)
-            replacer_window.replace_entry.setText(new_text)
-
-            log_buffer.log('Cache', f'Added {len(asset_ids)} asset ID(s) to replacer')
+            # Append only IDs not already listed, in place at the end
+            entry = replacer_window.replace_entry
+            current_text = entry.text()
+            existing = dict.fromkeys(s.strip() for s in current_text.split(',') if s.strip())
+            added = [a for a in dict.fromkeys(asset_ids) if a not in existing]
+            if added:
+                prefix = ', ' if existing else ''
+                entry.end(False)
+                entry.insert(prefix + ', '.join(added))
+            total = len(existing) + len(added)
+
+            log_buffer.log('Cache', f'Added {len(added)} asset ID(s) to replacer ({total} total)')
             QMessageBox.information(
                 self,
                 'Added to Replacer',
-                f'Added {len(asset_ids)} asset ID(s) to replacer:\n{", ".join(asset_ids[:5])}{"..." if len(asset_ids) > 5 else ""}'
+                f'Added {len(added)} asset ID(s) to replacer ({total} total):\n{", ".join(added[:5])}{"..." if len(added) > 5 else ""}'
             )
         else:
             # Fallback: copy to clipboard if not in replacer window
@@ -1622,49 +2122,62 @@ class CacheViewerTab(QWidget):
         self.image_label.setText('Select an asset to preview')
         self.image_label.show()
         self._current_pixmap = None
+        self._scaled_cache.clear()
         self.audio_wrapper.hide()
         if self.audio_player:
-            self.audio_player.stop()
-            self.audio_player.deleteLater()
-            self.audio_player = None
+            # Drop the decoded PCM too; the player is kept for the next preview
+            self.audio_player.unload()
         self.animation_viewer.hide()
         self.animation_viewer.clear()
         self.text_viewer.hide()
         self.text_viewer.clear()
 
-        # Clean up texture pack widgets
+        # Texture pack rows are kept for the next texture pack preview
         if self.texturepack_widget is not None:
-            self.texturepack_widget.deleteLater()
-            self.texturepack_widget = None
+            self.texturepack_widget.hide()
 
     def _stop_all_loaders(self):
-        """Stop all running preview loader threads."""
-        if self._image_loader is not None:
-            self._image_loader.stop()
-            self._image_loader.quit()
-            self._image_loader.wait()
-            self._image_loader = None
-
-        if self._mesh_loader is not None:
-            self._mesh_loader.stop()
-            self._mesh_loader.quit()
-            self._mesh_loader.wait()
-            self._mesh_loader = None
-
-        if self._animation_loader is not None:
-            self._animation_loader.stop()
-            self._animation_loader.quit()
-            self._animation_loader.wait()
-            self._animation_loader = None
-
-        if self._texturepack_loader is not None:
-            self._texturepack_loader.stop()
-            self._texturepack_loader.quit()
-            self._texturepack_loader.wait()
-            self._texturepack_loader = None
+        """Stop all running preview loaders without waiting for them."""
+        # Results already queued by the old loaders are dropped by the token check
+        self._preview_token = object()
+
+        for loader in (self._image_loader, self._mesh_loader, self._animation_loader,
+                       self._texturepack_loader, self._audio_writer):
+            if loader is not None:
+                loader.stop()
+        self._image_loader = None
+        self._mesh_loader = None
+        self._animation_loader = None
+        self._texturepack_loader = None
+        self._audio_writer = None
+
+    def _start_loader(self, loader: QObject):
+        """Run a preview loader on the preview pool."""
+        self._preview_pool.start(PreviewLoaderTask(loader))
+
+    def _for_current_preview(self, slot):
+        """Wrap a loader slot so results from a superseded preview are ignored."""
+        token = self._preview_token
+        return lambda *args: slot(*args) if token is self._preview_token else None
 
     def _on_splitter_moved(self, pos: int, index: int):
         """Handle splitter resize to rescale image."""
+        if self._current_pixmap is not None and self.image_label.isVisible():
+            # Moves arriving while a fast scale is queued fold into that one
+            if abs(pos - self._last_splitter_pos) >= 4 and not self._scale_pending:
+                self._last_splitter_pos = pos
+                self._scale_pending = True
+                QTimer.singleShot(0, self._apply_fast_scale)
+            self._smooth_timer.start(120)
+
+    def _apply_fast_scale(self):
+        """Run the queued fast rescale for the latest splitter position."""
+        self._scale_pending = False
+        if self._current_pixmap is not None and self.image_label.isVisible():
+            self._scale_and_show_image(self._current_pixmap, smooth=False)
+
+    def _apply_smooth_scale(self):
+        """Redo the image scale with smoothing once the splitter settles."""
         if self._current_pixmap is not None and self.image_label.isVisible():
             self._scale_and_show_image(self._current_pixmap)
 
@@ -1678,24 +2191,28 @@ class CacheViewerTab(QWidget):
 
     def _preview_mesh(self, data: bytes, asset_id: str):
         """Preview a mesh asset in 3D using background thread."""
-        self._mesh_loader = MeshLoaderThread(data, asset_id)
-        self._mesh_loader.mesh_ready.connect(self._on_mesh_ready)
-        self._mesh_loader.error.connect(lambda e: self._show_text_preview(f'Mesh error: {e}'))
-        self._mesh_loader.start()
+        self._mesh_loader = MeshLoader(data, asset_id)
+        self._mesh_loader.mesh_ready.connect(self._for_current_preview(self._on_mesh_ready))
+        self._mesh_loader.error.connect(
+            self._for_current_preview(lambda e: self._show_text_preview(f'Mesh error: {e}'))
+        )
+        self._start_loader(self._mesh_loader)
 
-    def _on_mesh_ready(self, obj_content: str):
+    def _on_mesh_ready(self, mesh: 'mesh_processing.MeshData'):
         """Handle mesh loaded from background thread."""
         self._hide_loading()
-        self.obj_viewer.load_obj(obj_content, '')
+        self.obj_viewer.load_mesh(mesh.positions, mesh.faces, mesh.normals)
         self.obj_viewer.show()
         self.stop_preview_btn.show()
 
     def _preview_image(self, data: bytes):
         """Preview an image asset using background thread."""
-        self._image_loader = ImageLoaderThread(data)
-        self._image_loader.image_ready.connect(self._on_image_ready)
-        self._image_loader.error.connect(lambda e: self._show_text_preview(f'Image error: {e}'))
-        self._image_loader.start()
+        self._image_loader = ImageLoader(data)
+        self._image_loader.image_ready.connect(self._for_current_preview(self._on_image_ready))
+        self._image_loader.error.connect(
+            self._for_current_preview(lambda e: self._show_text_preview(f'Image error: {e}'))
+        )
+        self._start_loader(self._image_loader)
 
     def _on_image_ready(self, pixmap: QPixmap):
         """Handle image loaded from background thread."""
@@ -1705,22 +2222,31 @@ class CacheViewerTab(QWidget):
         self.image_label.show()
         self.stop_preview_btn.show()
 
-    def _scale_and_show_image(self, pixmap: QPixmap):
+    def _scale_and_show_image(self, pixmap: QPixmap, smooth: bool = True):
         """Scale pixmap to fit container and display it."""
-        container_width = self.preview_scroll.viewport().width() - 20
-        container_height = self.preview_scroll.viewport().height() - 20
+        container_width = self._viewport_w - 20
+        container_height = self._viewport_h - 20
 
         if container_width < 100:
             container_width = 400
         if container_height < 100:
             container_height = 400
 
-        # Scale to fit within container while maintaining aspect ratio
-        scaled = pixmap.scaled(
-            container_width, container_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        # Reuse a previous scale to the same size
+        key = (pixmap.cacheKey(), container_width, container_height, smooth)
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            self._scaled_cache.move_to_end(key)
+        else:
+            # Scale to fit within container while maintaining aspect ratio
+            scaled = pixmap.scaled(
+                container_width, container_height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
+            )
+            self._scaled_cache[key] = scaled
+            if len(self._scaled_cache) > 8:
+                self._scaled_cache.popitem(last=False)
 
         self.image_label.setPixmap(scaled)
 
@@ -1743,15 +2269,11 @@ class CacheViewerTab(QWidget):
         import xml.etree.ElementTree as ET
 
         try:
-            # Clean up previous texture pack if any
-            if self.texturepack_widget is not None:
-                self.texturepack_widget.deleteLater()
-                self.texturepack_widget = None
+            # Stop loading the previous texture pack if any
             if self._texturepack_loader is not None:
                 self._texturepack_loader.stop()
-                self._texturepack_loader.quit()
-                self._texturepack_loader.wait()
                 self._texturepack_loader = None
+                self._preview_token = object()
 
             # Parse XML to get texture map IDs
             xml_text = data.decode('utf-8', errors='replace')
@@ -1759,9 +2281,8 @@ class CacheViewerTab(QWidget):
             root = ET.fromstring(xml_text)
 
             # Extract texture map IDs in order
-            map_order = ['color', 'normal', 'metalness', 'roughness']
             maps = {}
-            for elem in map_order:
+            for elem in _TEXTUREPACK_MAPS:
                 node = root.find(elem)
                 if node is not None and node.text:
                     maps[elem.capitalize()] = node.text
@@ -1773,53 +2294,78 @@ class CacheViewerTab(QWidget):
             # Clear texture data storage
             self._texturepack_data = {}
 
-            # Create container widget for texture pack preview
+            # Store references for async loading
+            self._tp_image_labels = {}
+            self._tp_pixmaps = {}  # Store pixmaps for copy
+
+            # Reuse the row widgets, resetting one placeholder per texture map
+            rows = self._texturepack_rows()
+            for (header, img_label), (map_name, map_id) in zip(rows, maps.items()):
+                header.setText(f'{map_name}  |  {map_id}')
+                img_label.clear()
+                img_label.setText('Loading...')
+                img_label.setStyleSheet('background-color: #333; padding: 10px; min-height: 100px;')
+                img_label.setProperty('map_name', map_name)
+                img_label.setProperty('map_id', map_id)
+                img_label.setProperty('map_hash', None)
+                header.show()
+                img_label.show()
+                self._tp_image_labels[map_name] = img_label
+            for header, img_label in rows[len(maps):]:
+                header.hide()
+                img_label.hide()
+                img_label.clear()
+
+            self.texturepack_widget.show()
+            self.stop_preview_btn.show()
+
+            # Start async loading of textures
+            self._texturepack_loader = TexturePackLoader(maps, self.cache_manager)
+            self._texturepack_loader.texture_loaded.connect(
+                self._for_current_preview(self._on_texturepack_texture_loaded)
+            )
+            self._texturepack_loader.texture_error.connect(
+                self._for_current_preview(self._on_texturepack_texture_error)
+            )
+            self._start_loader(self._texturepack_loader)
+
+        except Exception as e:
+            self._show_text_preview(f'Texture pack preview error: {e}')
+
+    def _texturepack_rows(self) -> list[tuple[QLabel, QLabel]]:
+        """Return the (header, image) label rows, building the widget on first use."""
+        if self.texturepack_widget is None:
             self.texturepack_widget = QWidget()
             tp_layout = QVBoxLayout()
             tp_layout.setContentsMargins(0, 0, 0, 0)
             tp_layout.setSpacing(10)
 
-            # Store references for async loading
-            self._tp_image_labels = {}
-            self._tp_pixmaps = {}  # Store pixmaps for copy
-
-            # Create placeholder for each texture map
-            for map_name, map_id in maps.items():
+            self._tp_rows = []
+            for _ in _TEXTUREPACK_MAPS:
                 # Header with name and id
-                header = QLabel(f'{map_name}  |  {map_id}')
+                header = QLabel()
                 header.setStyleSheet('font-weight: bold; color: #888; padding: 5px;')
                 header.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
                 tp_layout.addWidget(header)
 
-                # Image placeholder with context menu
-                img_label = QLabel('Loading...')
+                # Image placeholder with context menu; it reads the map from
+                # the label's properties, so one connection serves every preview
+                img_label = QLabel()
                 img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                img_label.setStyleSheet('background-color: #333; padding: 10px; min-height: 100px;')
                 img_label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-                img_label.setProperty('map_name', map_name)
-                img_label.setProperty('map_id', map_id)
                 img_label.customContextMenuRequested.connect(
                     lambda pos, lbl=img_label: self._show_texturepack_context_menu(pos, lbl)
                 )
                 tp_layout.addWidget(img_label)
-                self._tp_image_labels[map_name] = img_label
+                self._tp_rows.append((header, img_label))
 
             tp_layout.addStretch()
             self.texturepack_widget.setLayout(tp_layout)
             self.preview_container_layout.addWidget(self.texturepack_widget)
-            self.texturepack_widget.show()
-            self.stop_preview_btn.show()
-
-            # Start async loading of textures
-            self._texturepack_loader = TexturePackLoaderThread(maps, self.cache_manager)
-            self._texturepack_loader.texture_loaded.connect(self._on_texturepack_texture_loaded)
-            self._texturepack_loader.texture_error.connect(self._on_texturepack_texture_error)
-            self._texturepack_loader.start()
-
-        except Exception as e:
-            self._show_text_preview(f'Texture pack preview error: {e}')
+        return self._tp_rows
 
-    def _on_texturepack_texture_loaded(self, map_name: str, map_id: str, hash_val: str, data: bytes):
+    def _on_texturepack_texture_loaded(self, map_name: str, map_id: str, hash_val: str, data: bytes,
+                                       pixels: bytes, width: int, height: int, has_alpha: bool):
         """Handle loaded texture from texture pack."""
         # Hide loading on first texture
         self._hide_loading()
@@ -1845,40 +2391,35 @@ class CacheViewerTab(QWidget):
             # Update label property with hash
             img_label.setProperty('map_hash', hash_val)
 
-            # Load image
-            image = Image.open(io.BytesIO(data))
-            if image.mode not in ('RGB', 'RGBA'):
-                image = image.convert('RGBA')
-            elif image.mode == 'RGB':
-                image = image.convert('RGBA')
-
-            # Scale up small images to 512x512 minimum
-            min_size = 512
-            if image.width < min_size or image.height < min_size:
-                # Scale to at least 512 on the smaller dimension
-                scale_factor = max(min_size / image.width, min_size / image.height)
-                new_width = int(image.width * scale_factor)
-                new_height = int(image.height * scale_factor)
-                image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
-
-            qimage = QImage(
-                image.tobytes(),
-                image.width,
-                image.height,
-                QImage.Format.Format_RGBA8888
-            )
+            # Wrap the pixels decoded by the loader thread without copying;
+            # fromImage takes its own copy, so pixels only has to outlive qimage
+            if has_alpha:
+                qimage = QImage(pixels, width, height, 4 * width, QImage.Format.Format_RGBA8888)
+            else:
+                qimage = QImage(pixels, width, height, 3 * width, QImage.Format.Format_RGB888)
             pixmap = QPixmap.fromImage(qimage)
 
             # Store original pixmap for copy
             self._tp_pixmaps[map_name] = pixmap
 
             # Scale to fit container
-            container_width = self.preview_scroll.viewport().width() - 30
+            container_width = self._viewport_w - 30
             if container_width < 100:
                 container_width = 400
 
-            if pixmap.width() > container_width:
-                scaled = pixmap.scaledToWidth(container_width, Qt.TransformationMode.SmoothTransformation)
+            # Show small maps at least 512 px on the smaller dimension
+            min_size = 512
+            target_width = pixmap.width()
+            if pixmap.width() < min_size or pixmap.height() < min_size:
+                scale_factor = max(min_size / pixmap.width(), min_size / pixmap.height())
+                target_width = int(pixmap.width() * scale_factor)
+            target_width = min(target_width, container_width)
+
+            # Single scale to the display width; upscales stay pixelated
+            if target_width > pixmap.width():
+                scaled = pixmap.scaledToWidth(target_width, Qt.TransformationMode.FastTransformation)
+            elif target_width < pixmap.width():
+                scaled = pixmap.scaledToWidth(target_width, Qt.TransformationMode.SmoothTransformation)
             else:
                 scaled = pixmap
 
@@ -1949,84 +2490,75 @@ class CacheViewerTab(QWidget):
             QApplication.clipboard().setText(self._texturepack_xml)
 
     def _preview_audio(self, data: bytes, asset_id: str):
-        """Preview an audio asset."""
-        import tempfile
-        from pathlib import Path
-
-        try:
-            # Create temporary file for audio
-            temp_dir = Path(tempfile.gettempdir()) / 'fleasion_audio'
-            temp_dir.mkdir(exist_ok=True)
-
-            # Determine file extension (default to mp3)
-            temp_file = temp_dir / f'{asset_id}.mp3'
-
-            # Write audio data to temp file
-            with open(temp_file, 'wb') as f:
-                f.write(data)
-
-            # Create audio player with config manager for volume persistence
-            self.audio_player = AudioPlayerWidget(str(temp_file), self, self.config_manager)
+        """Preview an audio asset, writing its temp file in the background."""
+        self._audio_writer = AudioFileWriter(data, asset_id)
+        token = self._preview_token
+        # A file written for a superseded preview is deleted instead of played
+        self._audio_writer.file_ready.connect(
+            lambda temp_file: self._on_audio_file_ready(temp_file)
+            if token is self._preview_token else _remove_temp_file(temp_file)
+        )
+        self._audio_writer.error.connect(self._for_current_preview(self._on_audio_preview_error))
+        self._start_loader(self._audio_writer)
 
-            # Clear previous audio widgets
-            while self.audio_container_layout.count():
-                child = self.audio_container_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+    def _on_audio_preview_error(self, error: str):
+        """Handle a failed audio preview."""
+        self._show_text_preview(f'Audio preview error: {error}')
+        log_buffer.log('Cache', f'Audio preview error: {error}')
 
-            # Add new audio player
-            self.audio_container_layout.addWidget(self.audio_player)
+    def _on_audio_file_ready(self, temp_file: str):
+        """Show the audio player once the temp file has been written."""
+        try:
+            if self.audio_player is None:
+                # Created once with config manager for volume persistence
+                self.audio_player = AudioPlayerWidget(temp_file, self, self.config_manager)
+                self.audio_container_layout.addWidget(self.audio_player)
+            else:
+                self.audio_player.set_source(temp_file)
             self.audio_wrapper.show()
             self.stop_preview_btn.show()
 
         except Exception as e:
-            self._show_text_preview(f'Audio preview error: {e}')
-            log_buffer.log('Cache', f'Audio preview error: {e}')
+            self._on_audio_preview_error(str(e))
+        finally:
+            # The player reads the whole file into memory, so it isn't needed after loading
+            _remove_temp_file(temp_file)
 
     def _preview_animation(self, data: bytes, asset_id: str):
         """Preview an animation asset (RBXM XML format) using background thread."""
         self._show_loading()
-        self._animation_loader = AnimationLoaderThread(data, asset_id)
-        self._animation_loader.animation_ready.connect(self._on_animation_ready)
-        self._animation_loader.error.connect(lambda e: self._show_text_preview(f'Animation error: {e}'))
-        self._animation_loader.start()
+        self._animation_loader = AnimationLoader(data, asset_id)
+        self._animation_loader.animation_ready.connect(self._for_current_preview(self._on_animation_ready))
+        self._animation_loader.error.connect(
+            self._for_current_preview(lambda e: self._show_text_preview(f'Animation error: {e}'))
+        )
+        self._start_loader(self._animation_loader)
 
     def _on_animation_ready(self, data: bytes):
         """Handle animation data ready from background thread."""
-        self._hide_loading()
         try:
             # Load in the animation viewer (must be on main thread for OpenGL)
             if self.animation_viewer.load_animation(data):
+                self._hide_loading()
                 self.animation_viewer.show()
                 self.stop_preview_btn.show()
                 return
 
-            # Fallback: try to decode as XML for text display
-            text = data.decode('utf-8', errors='replace')
-
-            # Check if it's XML
-            if text.strip().startswith('<'):
-                # Format XML for display
-                import xml.etree.ElementTree as ET
-                try:
-                    ET.fromstring(data)
-                    # Pretty print XML
-                    import xml.dom.minidom
-                    dom = xml.dom.minidom.parseString(data)
-                    pretty_xml = dom.toprettyxml(indent='  ')
-                    # Remove extra blank lines
-                    lines = [line for line in pretty_xml.split('\n') if line.strip()]
-                    self._show_text_preview('\n'.join(lines[:500]))  # Limit lines
-                except Exception:
-                    # Fallback to raw text
-                    self._show_text_preview(f'Animation data\nSize: {self._format_size(len(data))}\n\n{text[:5000]}')
-            else:
-                # Binary format, show hex
-                self._preview_hex(data, {'id': '', 'type_name': 'Animation'})
+            # Fallback: format the text off the GUI thread so XML is never parsed here
+            self._animation_loader = AnimationTextLoader(data)
+            self._animation_loader.text_ready.connect(self._for_current_preview(self._on_animation_text_ready))
+            self._start_loader(self._animation_loader)
 
         except Exception as e:
             self._show_text_preview(f'Animation preview error: {e}')
 
+    def _on_animation_text_ready(self, data: bytes, text: str):
+        """Show the text fallback for an animation, or hex for binary data."""
+        if text:
+            self._show_text_preview(text)
+        else:
+            self._preview_hex(data, {'id': '', 'type_name': 'Animation'})
+
     def _preview_hex(self, data: bytes, asset: dict):
         """Show hex dump preview."""
         # Show first 1KB as hex dump
@@ -2035,16 +2567,17 @@ class CacheViewerTab(QWidget):
 
         hex_lines.append(f"Asset ID: {asset['id']}")
         hex_lines.append(f"Type: {asset['type_name']}")
-        hex_lines.append(f"Size: {self._format_size(len(data))}")
+        hex_lines.append(f"Size: {_format_size(len(data))}")
         hex_lines.append(f"\nFirst {preview_size} bytes (hex dump):\n")
 
+        # Convert the whole preview once, then slice each row out of it
+        # (three hex characters per byte, including the separator)
+        head = data[:preview_size]
+        hex_all = head.hex(' ')
+        ascii_all = head.translate(_ASCII_TABLE).decode('ascii')
         for i in range(0, preview_size, 16):
-            hex_part = ' '.join(f'{b:02x}' for b in data[i:i+16])
-            ascii_part = ''.join(
-                chr(b) if 32 <= b < 127 else '.'
-                for b in data[i:i+16]
-            )
-            hex_lines.append(f'{i:08x}  {hex_part:<48}  {ascii_part}')
+            hex_part = hex_all[3 * i:3 * i + 47]
+            hex_lines.append(f'{i:08x}  {hex_part:<48}  {ascii_all[i:i + 16]}')
 
         if len(data) > preview_size:
             hex_lines.append(f'\n... ({len(data) - preview_size} more bytes)')
@@ -2,9 +2,17 @@
 # Complete Roblox mesh converter supporting versions 1.x through 7.00
 # Handles all mesh formats including Draco-compressed v6/v7 meshes
 
+import hashlib
+import os
 import struct
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 
 from ..utils import log_buffer
 
@@ -18,37 +26,44 @@ except ImportError:
 
 # Shared Data Structures
 
-class Vertex:
-    """Represents a single vertex with all attributes"""
-
-    def __init__(self):
-        # Position
-        self.px = self.py = self.pz = 0.0
-        # Normal
-        self.nx = self.ny = self.nz = 0.0
-        # UV coordinates
-        self.tu = self.tv = self.tw = 0.0
-        # Tangent (signed byte)
-        self.tx = self.ty = self.tz = self.ts = 0
-        # Color (RGBA)
-        self.r = self.g = self.b = self.a = 255
-
-
-class Face:
-    """Represents a triangular face (OBJ uses 1-based indexing)"""
-
-    def __init__(self, a=0, b=0, c=0):
-        self.a, self.b, self.c = a, b, c
+@dataclass
+class MeshData:
+    """Decoded mesh as per-vertex column arrays"""
+    positions: np.ndarray  # (N, 3) float
+    normals: np.ndarray    # (N, 3) float
+    uvs: np.ndarray        # (N, 2) float with V already flipped, or (N, 3) with W
+    faces: np.ndarray      # (M, 3) 0-based vertex indices
+
+# Binary vertex layouts (v2-v5): position, normal, uv, tangent (signed
+# bytes) and, in the 40-byte layout, RGBA color
+VERTEX_DTYPE_36 = np.dtype([
+    ('px', '<f4'), ('py', '<f4'), ('pz', '<f4'),
+    ('nx', '<f4'), ('ny', '<f4'), ('nz', '<f4'),
+    ('tu', '<f4'), ('tv', '<f4'),
+    ('tx', 'i1'), ('ty', 'i1'), ('tz', 'i1'), ('ts', 'i1'),
+])
+VERTEX_DTYPE_40 = np.dtype(VERTEX_DTYPE_36.descr + [
+    ('r', 'u1'), ('g', 'u1'), ('b', 'u1'), ('a', 'u1'),
+])
+
+# Precompiled little-endian readers
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_MESH_COUNTS = struct.Struct("<HII")  # LOD type, vertex count, face count
+_CHUNK_HEADER = struct.Struct("<8sII")  # v6/v7 chunk type, version, size
+
+# Per-version (expected header size, LOD count offset past the version line)
+HEADER_SPEC = {
+    "2.00": (12, 6), "3.00": (12, 6), "3.01": (12, 6),
+    "4.00": (24, 8), "4.01": (24, 8), "5.00": (32, 8),
+}
+_V2_TO_V5_HEADERS = frozenset(f"version {v}" for v in HEADER_SPEC)
+_V6_V7_HEADERS = frozenset(("version 6.00", "version 7.00"))
 
 
 # Utility Functions
 
-def fix_float(s: str) -> str:
-    """Convert comma decimals to period decimals for OBJ format"""
-    return s.replace(",", ".")
-
-
-def read_vertices(data: bytes, offset: int, count: int, vsize: int) -> tuple[list[Vertex], int]:
+def read_vertices(data: bytes, offset: int, count: int, vsize: int) -> tuple[np.ndarray, int]:
     """
     Read vertex data from binary mesh formats (v2-v5)
 
@@ -59,93 +74,50 @@ def read_vertices(data: bytes, offset: int, count: int, vsize: int) -> tuple[lis
         vsize: Size of each vertex (36 or 40 bytes)
 
     Returns:
-        Tuple of (vertex list, new offset)
+        Tuple of (structured vertex array with VERTEX_DTYPE_36/40 fields, new offset)
     """
-    verts = []
-    pos = offset
-
-    for _ in range(count):
-        v = Vertex()
-
-        # Position (3 floats)
-        v.px, = struct.unpack_from("<f", data, pos)
-        pos += 4
-        v.py, = struct.unpack_from("<f", data, pos)
-        pos += 4
-        v.pz, = struct.unpack_from("<f", data, pos)
-        pos += 4
-
-        # Normal (3 floats)
-        v.nx, = struct.unpack_from("<f", data, pos)
-        pos += 4
-        v.ny, = struct.unpack_from("<f", data, pos)
-        pos += 4
-        v.nz, = struct.unpack_from("<f", data, pos)
-        pos += 4
-
-        # UV coordinates (2 floats)
-        v.tu, = struct.unpack_from("<f", data, pos)
-        pos += 4
-        tv,   = struct.unpack_from("<f", data, pos)
-        pos += 4
-        v.tv = 1.0 - tv  # Flip V coordinate for Roblox
-
-        # Tangent (4 signed bytes)
-        v.tx, = struct.unpack_from("<b", data, pos)
-        pos += 1
-        v.ty, = struct.unpack_from("<b", data, pos)
-        pos += 1
-        v.tz, = struct.unpack_from("<b", data, pos)
-        pos += 1
-        v.ts, = struct.unpack_from("<b", data, pos)
-        pos += 1
-
-        # Color (4 unsigned bytes, only in 40-byte format)
-        if vsize == 40:
-            v.r, = struct.unpack_from("<B", data, pos)
-            pos += 1
-            v.g, = struct.unpack_from("<B", data, pos)
-            pos += 1
-            v.b, = struct.unpack_from("<B", data, pos)
-            pos += 1
-            v.a, = struct.unpack_from("<B", data, pos)
-            pos += 1
-
-        verts.append(v)
-
-    return verts, pos
-
-
-def write_obj_data(v_lines: list[str], n_lines: list[str], t_lines: list[str], f_lines: list[str]) -> str:
+    vdtype = VERTEX_DTYPE_40 if vsize == 40 else VERTEX_DTYPE_36
+
+    # One copy out of the buffer; frombuffer alone would be read-only
+    verts = np.frombuffer(data, dtype=vdtype, count=count, offset=offset).copy()
+    verts['tv'] = 1.0 - verts['tv']  # Flip V coordinate for Roblox
+
+    return verts, offset + count * vsize
+
+
+def write_obj(mesh: MeshData) -> str:
     """
-    Generate OBJ file content from vertex/normal/texture/face data
+    Generate OBJ file content from decoded mesh arrays
 
     Args:
-        v_lines: Vertex position lines
-        n_lines: Vertex normal lines
-        t_lines: Texture coordinate lines
-        f_lines: Face lines
+        mesh: Decoded mesh; uvs without a W column get W written as 0.0
 
     Returns:
         Complete OBJ file content as string
     """
-    lines = ["# Converted from Roblox mesh format\n"]
-    lines.append(f"# Vertices: {len(v_lines)}, Faces: {len(f_lines)}\n\n")
-
-    lines.extend(line + "\n" for line in v_lines)
-    lines.append("\n")
-    lines.extend(line + "\n" for line in n_lines)
-    lines.append("\n")
-    lines.extend(line + "\n" for line in t_lines)
-    lines.append("\n")
-    lines.extend(line + "\n" for line in f_lines)
-
-    return "".join(lines)
+    # Each section is a single %-format of a repeated line template over the
+    # flattened array, so there is no per-vertex Python code. %-formatting
+    # ignores the locale, so decimals are always periods. The text is pure
+    # ASCII and bytes formatting is faster, so it is built as bytes and
+    # decoded once at the end
+    num_verts, num_faces = len(mesh.positions), len(mesh.faces)
+    vt_line = b"vt %.6f %.6f %.6f\n" if mesh.uvs.shape[1] == 3 else b"vt %.6f %.6f 0.0\n"
+    obj_faces = np.repeat(mesh.faces + 1, 3, axis=1)  # OBJ uses 1-based indexing
+    sections = (
+        b"v %.6f %.6f %.6f\n" * num_verts % tuple(mesh.positions.ravel().tolist()),
+        b"vn %.6f %.6f %.6f\n" * num_verts % tuple(mesh.normals.ravel().tolist()),
+        vt_line * num_verts % tuple(mesh.uvs.ravel().tolist()),
+        b"f %d/%d/%d %d/%d/%d %d/%d/%d\n" * num_faces % tuple(obj_faces.ravel().tolist()),
+    )
+
+    header = b"# Converted from Roblox mesh format\n"
+    header += b"# Vertices: %d, Faces: %d\n\n" % (num_verts, num_faces)
+    return (header + b"\n".join(sections)).decode("ascii")
 
 
 # Version-Specific Processors
 
-def process_v1(data: bytes) -> str:
+def process_v1(data: bytes) -> MeshData | None:
     """
     Process version 1.x mesh format (JSON-based)
 
@@ -153,58 +125,45 @@ def process_v1(data: bytes) -> str:
         data: Complete mesh file data
 
     Returns:
-        OBJ file content as string, or None on failure
+        Decoded MeshData, or None on failure
     """
     try:
-        lines = data.decode('utf-8', errors='replace').splitlines()
-        if len(lines) < 3:
+        # Only the first three lines matter; json reads bytes directly, so
+        # the vertex line is never decoded or split further
+        lines = bytes(data).split(b"\n", 3)
+        if len(lines) < 3 or not lines[2].strip():
             log_buffer.log('Mesh',"Invalid v1 mesh: not enough lines")
             return None
 
-        version = lines[0].strip()
-
         # Parse JSON vertex data (on line 3)
         try:
             # Convert ][  to ],[  for valid JSON array
-            content = json.loads("[" + lines[2].replace("][", "],[") + "]")
-        except json.JSONDecodeError as e:
+            content = json.loads(b"[" + lines[2].replace(b"][", b"],[") + b"]")
+        except ValueError as e:
             log_buffer.log('Mesh',f"Failed to parse v1 JSON: {e}")
             return None
 
-        # Each vertex group has 3 elements: position, normal, uv
+        # Each vertex group has 3 elements: position [x, y, z],
+        # normal [x, y, z] and uv [u, v, w]
         groups = len(content) // 3
+        arr = np.asarray(content[:groups * 3], dtype=np.float64).reshape(groups, 3, 3)
 
-        verts = []
-        norms = []
-        uvs = []
-        faces = []
-
-        for i in range(groups):
-            v = content[i * 3]      # Position [x, y, z]
-            n = content[i * 3 + 1]  # Normal [x, y, z]
-            uv = content[i * 3 + 2]  # UV [u, v, w]
+        positions = arr[:, 0]
+        normals = arr[:, 1]
+        uvs = arr[:, 2].copy()
+        uvs[:, 1] = 1.0 - uvs[:, 1]
 
-            verts.append(
-                f"v {fix_float(str(v[0]))} {fix_float(str(v[1]))} {fix_float(str(v[2]))}")
-            norms.append(
-                f"vn {fix_float(str(n[0]))} {fix_float(str(n[1]))} {fix_float(str(n[2]))}")
-            uvs.append(
-                f"vt {fix_float(str(uv[0]))} {fix_float(str(1 - uv[1]))} {fix_float(str(uv[2]))}")
+        # Every 3 vertices form a triangle
+        faces = np.arange(groups // 3 * 3).reshape(-1, 3)
 
-        # Create faces (every 3 vertices form a triangle)
-        for i in range(0, groups, 3):
-            idx = i + 1  # OBJ uses 1-based indexing
-            faces.append(
-                f"f {idx}/{idx}/{idx} {idx+1}/{idx+1}/{idx+1} {idx+2}/{idx+2}/{idx+2}")
-
-        return write_obj_data(verts, norms, uvs, faces)
+        return MeshData(positions, normals, uvs, faces)
 
     except Exception as e:
         log_buffer.log('Mesh',f"Error processing v1 mesh: {e}")
         return None
 
 
-def process_v2_to_v5(data: bytes, version_num: str) -> str:
+def process_v2_to_v5(data: bytes, version_num: str) -> MeshData | None:
     """
     Process version 2.00 through 5.00 mesh formats
 
@@ -213,33 +172,24 @@ def process_v2_to_v5(data: bytes, version_num: str) -> str:
         version_num: Version string (e.g., "3.00", "4.01", "5.00")
 
     Returns:
-        OBJ file content as string, or None on failure
+        Decoded MeshData, or None on failure
     """
     try:
         offset = 13  # Skip "version X.XX\n"
 
         # Read header
-        header_size = struct.unpack_from("<H", data, offset)[0]
+        header_size = _U16.unpack_from(data, offset)[0]
         offset += 2
 
         # Validate header size
-        expected_header_size = {
-            "2.00": 12, "3.00": 12, "3.01": 12,
-            "4.00": 24, "4.01": 24, "5.00": 32
-        }
-
-        if version_num in expected_header_size:
-            if header_size != expected_header_size[version_num]:
-                log_buffer.log('Mesh',
-                    f"Warning: Unexpected header size {header_size} for version {version_num}")
+        expected_header_size, lod_count_delta = HEADER_SPEC[version_num]
+        if header_size != expected_header_size:
+            log_buffer.log('Mesh',
+                f"Warning: Unexpected header size {header_size} for version {version_num}")
 
         # Read mesh data counts
-        lod_type = struct.unpack_from("<H", data, offset)[0]
-        offset += 2
-        num_verts = struct.unpack_from("<I", data, offset)[0]
-        offset += 4
-        num_faces = struct.unpack_from("<I", data, offset)[0]
-        offset += 4
+        lod_type, num_verts, num_faces = _MESH_COUNTS.unpack_from(data, offset)
+        offset += _MESH_COUNTS.size
 
         remaining = header_size - 12
         if remaining < 0:
@@ -252,27 +202,24 @@ def process_v2_to_v5(data: bytes, version_num: str) -> str:
         # Read vertices (40 bytes each in these versions)
         verts, offset = read_vertices(data, offset, num_verts, 40)
 
-        # Read faces
-        faces = []
-        for _ in range(num_faces):
-            a, b, c = struct.unpack_from("<III", data, offset)
-            faces.append(Face(a + 1, b + 1, c + 1))  # Convert to 1-based
-            offset += 12
+        positions = structured_to_unstructured(verts[['px', 'py', 'pz']])
+        normals = structured_to_unstructured(verts[['nx', 'ny', 'nz']])
+        uvs = structured_to_unstructured(verts[['tu', 'tv']])
+
+        # Read faces (three u32 indices each)
+        faces = np.frombuffer(data, dtype='<u4', count=num_faces * 3, offset=offset)
+        faces = faces.reshape(num_faces, 3).astype(np.int64)
+        offset += num_faces * 12
 
         # Apply LOD trimming if available
         if lod_type != 0 and num_faces > 0:
             try:
                 # Read LOD count from header
-                if version_num in ["4.00", "4.01", "5.00"]:
-                    lod_count_offset = 13 + 8
-                else:
-                    lod_count_offset = 13 + 6
-
-                num_lods = struct.unpack_from("<H", data, lod_count_offset)[0]
+                num_lods = _U16.unpack_from(data, 13 + lod_count_delta)[0]
 
                 if num_lods >= 2:
                     # Read second LOD offset (highest quality)
-                    lod1_offset = struct.unpack_from("<I", data, offset + 4)[0]
+                    lod1_offset = _U32.unpack_from(data, offset + 4)[0]
                     if lod1_offset < len(faces):
                         original_count = len(faces)
                         faces = faces[:lod1_offset]
@@ -281,24 +228,14 @@ def process_v2_to_v5(data: bytes, version_num: str) -> str:
             except:
                 pass  # Use full face count if LOD parsing fails
 
-        # Generate OBJ lines
-        v_lines = [f"v {fix_float(f'{v.px:.6f}')} {fix_float(f'{v.py:.6f}')} {
-            fix_float(f'{v.pz:.6f}')}" for v in verts]
-        n_lines = [f"vn {fix_float(f'{v.nx:.6f}')} {fix_float(f'{v.ny:.6f}')} {
-            fix_float(f'{v.nz:.6f}')}" for v in verts]
-        t_lines = [f"vt {fix_float(f'{v.tu:.6f}')} {
-            fix_float(f'{v.tv:.6f}')} 0.0" for v in verts]
-        f_lines = [
-            f"f {f.a}/{f.a}/{f.a} {f.b}/{f.b}/{f.b} {f.c}/{f.c}/{f.c}" for f in faces]
-
-        return write_obj_data(v_lines, n_lines, t_lines, f_lines)
+        return MeshData(positions, normals, uvs, faces)
 
     except Exception as e:
         log_buffer.log('Mesh',f"Error processing v{version_num} mesh: {e}")
         return None
 
 
-def process_v6_v7(data: bytes) -> str:
+def process_v6_v7(data: bytes) -> MeshData | None:
     """
     Process version 6.00 and 7.00 mesh formats (Draco-compressed)
 
@@ -306,7 +243,7 @@ def process_v6_v7(data: bytes) -> str:
         data: Complete mesh file data
 
     Returns:
-        OBJ file content as string, or None on failure
+        Decoded MeshData, or None on failure
     """
     if not DRACO_AVAILABLE:
         log_buffer.log('Mesh',"DracoPy not available - cannot process v6/v7 meshes")
@@ -319,25 +256,22 @@ def process_v6_v7(data: bytes) -> str:
         coremesh_data = None
         lod_data = None
 
+        # Chunks are sliced from a view so skipped chunks are never copied
+        view = memoryview(data)
+
         # Parse chunk-based format
         while offset < len(data):
             # Read chunk header
-            if offset + 16 > len(data):
+            if offset + _CHUNK_HEADER.size > len(data):
                 break
 
-            chunk_type = data[offset:offset +
-                              8].decode('utf-8', errors='ignore').rstrip('\0')
-            offset += 8
-
-            chunk_ver = struct.unpack_from("<I", data, offset)[0]
-            offset += 4
-
-            chunk_size = struct.unpack_from("<I", data, offset)[0]
-            offset += 4
+            tag, chunk_ver, chunk_size = _CHUNK_HEADER.unpack_from(data, offset)
+            chunk_type = tag.decode('utf-8', errors='ignore').rstrip('\0')
+            offset += _CHUNK_HEADER.size
 
             # Handle version 2 chunks (have additional data_size field)
             if chunk_ver == 2:
-                data_size = struct.unpack_from("<I", data, offset)[0]
+                data_size = _U32.unpack_from(data, offset)[0]
                 offset += 4
             else:
                 data_size = chunk_size
@@ -347,11 +281,11 @@ def process_v6_v7(data: bytes) -> str:
                 log_buffer.log('Mesh',f"Warning: Chunk {chunk_type} exceeds file size")
                 break
 
-            chunk_content = data[offset:offset + data_size]
+            chunk_content = view[offset:offset + data_size]
 
-            # Store relevant chunks
+            # Store relevant chunks; DracoPy only accepts bytes
             if chunk_type == "COREMESH" and chunk_ver == 2:
-                coremesh_data = chunk_content
+                coremesh_data = bytes(chunk_content)
             elif chunk_type == "LODS":
                 lod_data = chunk_content
 
@@ -369,48 +303,41 @@ def process_v6_v7(data: bytes) -> str:
                 log_buffer.log('Mesh',"Draco decode failed: invalid mesh data")
                 return None
 
-            # Extract vertex positions
-            positions = np.array(mesh.points, dtype=np.float32)
+            # Extract vertex positions; DracoPy already returns contiguous
+            # float32 arrays, which are used as-is rather than copied
+            positions = np.ascontiguousarray(mesh.points, dtype=np.float32)
             num_verts = len(positions)
 
             if num_verts == 0:
                 log_buffer.log('Mesh',"Draco mesh has no vertices")
                 return None
 
-            # Create vertex array
-            verts = [Vertex() for _ in range(num_verts)]
-            for i in range(num_verts):
-                verts[i].px, verts[i].py, verts[i].pz = positions[i]
-
-            # Extract normals if available
+            # Extract normals if available (zero otherwise)
+            normals = np.zeros((num_verts, 3), dtype=np.float32)
             if hasattr(mesh, 'normals') and mesh.normals is not None:
-                normals = np.array(mesh.normals, dtype=np.float32)
-                if len(normals) == num_verts:
-                    for i in range(num_verts):
-                        verts[i].nx, verts[i].ny, verts[i].nz = normals[i]
+                mesh_normals = np.ascontiguousarray(mesh.normals, dtype=np.float32)
+                if len(mesh_normals) == num_verts:
+                    normals = mesh_normals
                 else:
                     log_buffer.log('Mesh',
-                        f"Warning: Normal count mismatch ({len(normals)} vs {num_verts})")
+                        f"Warning: Normal count mismatch ({len(mesh_normals)} vs {num_verts})")
 
-            # Extract UV coordinates if available
+            # Extract UV coordinates if available (zero otherwise)
+            uvs = np.zeros((num_verts, 2), dtype=np.float32)
             if hasattr(mesh, 'tex_coords') and mesh.tex_coords is not None:
-                tex_coords = np.array(mesh.tex_coords, dtype=np.float32)
+                tex_coords = np.ascontiguousarray(mesh.tex_coords, dtype=np.float32)
                 if len(tex_coords) == num_verts:
-                    for i in range(num_verts):
-                        u, v = tex_coords[i]
-                        verts[i].tu = u
-                        verts[i].tv = 1.0 - v  # Flip V for Roblox
+                    uvs = tex_coords
+                    uvs[:, 1] = 1.0 - uvs[:, 1]  # Flip V for Roblox
                 else:
                     log_buffer.log('Mesh',
                         f"Warning: UV count mismatch ({len(tex_coords)} vs {num_verts})")
 
             # Extract faces
-            faces = []
+            faces = np.empty((0, 3), dtype=np.int64)
             if hasattr(mesh, 'faces') and mesh.faces is not None:
-                for tri in mesh.faces:
-                    a, b, c = map(int, tri)
-                    # Reverse winding order and convert to 1-based indexing
-                    faces.append(Face(a + 1, c + 1, b + 1))
+                # Reverse winding order
+                faces = np.asarray(mesh.faces, dtype=np.int64).reshape(-1, 3)[:, [0, 2, 1]]
 
             log_buffer.log('Mesh',
                 f"Draco mesh decoded: {num_verts:,} vertices, {len(faces):,} faces")
@@ -429,17 +356,14 @@ def process_v6_v7(data: bytes) -> str:
                     lod_pos += 1
 
                     # Read number of LOD offsets
-                    num_offsets = struct.unpack_from(
-                        "<I", lod_data, lod_pos)[0]
+                    num_offsets = _U32.unpack_from(lod_data, lod_pos)[0]
                     lod_pos += 4
 
                     if num_offsets >= 2:
                         # Read first two offsets
-                        offset1 = struct.unpack_from(
-                            "<I", lod_data, lod_pos)[0]
+                        offset1 = _U32.unpack_from(lod_data, lod_pos)[0]
                         lod_pos += 4
-                        offset2 = struct.unpack_from(
-                            "<I", lod_data, lod_pos)[0]
+                        offset2 = _U32.unpack_from(lod_data, lod_pos)[0]
 
                         # Calculate high-quality face count
                         max_faces = offset2 - offset1
@@ -455,17 +379,7 @@ def process_v6_v7(data: bytes) -> str:
             if max_faces < len(faces):
                 faces = faces[:max_faces]
 
-            # Generate OBJ lines
-            v_lines = [f"v {fix_float(f'{v.px:.6f}')} {fix_float(f'{v.py:.6f}')} {
-                fix_float(f'{v.pz:.6f}')}" for v in verts]
-            n_lines = [f"vn {fix_float(f'{v.nx:.6f}')} {fix_float(f'{v.ny:.6f}')} {
-                fix_float(f'{v.nz:.6f}')}" for v in verts]
-            t_lines = [f"vt {fix_float(f'{v.tu:.6f}')} {
-                fix_float(f'{v.tv:.6f}')} 0.0" for v in verts]
-            f_lines = [
-                f"f {f.a}/{f.a}/{f.a} {f.b}/{f.b}/{f.b} {f.c}/{f.c}/{f.c}" for f in faces]
-
-            return write_obj_data(v_lines, n_lines, t_lines, f_lines)
+            return MeshData(positions, normals, uvs, faces)
 
         except Exception as e:
             log_buffer.log('Mesh',f"DracoPy decoding error: {e}")
@@ -482,42 +396,136 @@ def process_v6_v7(data: bytes) -> str:
 
 # Main Conversion Function
 
-def convert(data: bytes, output_path: str = None) -> str:
-    """
-    Convert Roblox mesh data to OBJ format
+def _decode(data: bytes) -> MeshData | None:
+    """Decode mesh data of at least 12 bytes, bypassing the cache."""
+    # Detect version from header
+    header = data[:12].decode('utf-8', errors='ignore').strip()
+    log_buffer.log('Mesh',f"Detected mesh version: {header}")
 
-    Args:
-        data: Binary mesh file data
-        output_path: Optional path to write OBJ file to
+    # Route to appropriate processor
+    if header.startswith("version 1."):
+        return process_v1(data)
 
-    Returns:
-        OBJ file content as string, or None on failure
+    elif header in _V2_TO_V5_HEADERS:
+        version_num = header[8:]  # Extract "X.XX"
+        return process_v2_to_v5(data, version_num)
+
+    elif header in _V6_V7_HEADERS:
+        return process_v6_v7(data)
+
+    log_buffer.log('Mesh',f"Unsupported mesh version: {header}")
+    return None
+
+
+# Recently decoded meshes by content hash, most recent last. Each entry is
+# [MeshData, OBJ text or None until convert() first formats it, size in bytes].
+# Bounded by total size, since a single large mesh can run to hundreds of MB
+_MESH_CACHE_BUDGET = 256 * 1024 * 1024
+_mesh_cache: OrderedDict[bytes, list] = OrderedDict()
+_mesh_cache_bytes = 0
+_mesh_cache_lock = threading.Lock()  # decode() runs on worker threads
+
+
+def _trim_mesh_cache():
+    """Evict the least recently used meshes until the cache fits its budget (lock held)."""
+    global _mesh_cache_bytes
+    while _mesh_cache_bytes > _MESH_CACHE_BUDGET and _mesh_cache:
+        _, evicted = _mesh_cache.popitem(last=False)
+        _mesh_cache_bytes -= evicted[2]
+
+
+def _cache_entry(data: bytes) -> tuple[bytes, list] | None:
+    """Return the key and cache entry for data, decoding and caching it on a miss.
+
+    Meshes too large for the cache are returned in an entry that isn't stored.
     """
+    global _mesh_cache_bytes
     if not data or len(data) < 12:
         log_buffer.log('Mesh',"Invalid mesh data: file too small")
         return None
 
-    # Detect version from header
-    header = data[:12].decode('utf-8', errors='ignore').strip()
-    log_buffer.log('Mesh',f"Detected mesh version: {header}")
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    with _mesh_cache_lock:
+        entry = _mesh_cache.get(key)
+        if entry is not None:
+            _mesh_cache.move_to_end(key)
+            return key, entry
 
-    obj_content = None
+    mesh = _decode(data)
+    if mesh is None:
+        return None
+
+    # Callers share the cached arrays, so keep them from being modified
+    arrays = (mesh.positions, mesh.normals, mesh.uvs, mesh.faces)
+    for array in arrays:
+        array.flags.writeable = False
+
+    entry = [mesh, None, sum(array.nbytes for array in arrays)]
+    if entry[2] <= _MESH_CACHE_BUDGET:
+        with _mesh_cache_lock:
+            previous = _mesh_cache.pop(key, None)
+            if previous is not None:
+                _mesh_cache_bytes -= previous[2]
+            _mesh_cache[key] = entry
+            _mesh_cache_bytes += entry[2]
+            _trim_mesh_cache()
+    return key, entry
+
+
+def _cache_obj_text(key: bytes, entry: list, obj_content: str):
+    """Store formatted OBJ text on an entry, counting it against the cache budget."""
+    global _mesh_cache_bytes
+    with _mesh_cache_lock:
+        if entry[1] is not None:
+            return
+        entry[1] = obj_content
+        entry[2] += len(obj_content)
+        if _mesh_cache.get(key) is entry:
+            _mesh_cache_bytes += len(obj_content)
+            if entry[2] > _MESH_CACHE_BUDGET:
+                # Too large to keep as a whole; give the room back to other meshes
+                del _mesh_cache[key]
+                _mesh_cache_bytes -= entry[2]
+            else:
+                _trim_mesh_cache()
 
-    # Route to appropriate processor
-    if header.startswith("version 1."):
-        obj_content = process_v1(data)
 
-    elif header in ["version 2.00", "version 3.00", "version 3.01",
-                    "version 4.00", "version 4.01", "version 5.00"]:
-        version_num = header.split()[1]  # Extract "X.XX"
-        obj_content = process_v2_to_v5(data, version_num)
+def decode(data: bytes) -> MeshData | None:
+    """
+    Decode Roblox mesh data of any supported version
+
+    Results are cached by content, so the returned arrays are read-only.
+
+    Args:
+        data: Binary mesh file data
+
+    Returns:
+        Decoded MeshData, or None on failure
+    """
+    cached = _cache_entry(data)
+    return cached[1][0] if cached is not None else None
+
+
+def convert(data: bytes, output_path: str = None) -> str:
+    """
+    Convert Roblox mesh data to OBJ format
 
-    elif header in ["version 6.00", "version 7.00"]:
-        obj_content = process_v6_v7(data)
+    Args:
+        data: Binary mesh file data
+        output_path: Optional path to write OBJ file to
 
-    else:
-        log_buffer.log('Mesh',f"Unsupported mesh version: {header}")
+    Returns:
+        OBJ file content as string, or None on failure
+    """
+    cached = _cache_entry(data)
+    if cached is None:
         return None
+    key, entry = cached
+    obj_content = entry[1]
+    if obj_content is None:
+        obj_content = write_obj(entry[0])
+        if obj_content:
+            _cache_obj_text(key, entry, obj_content)
 
     # Write to file if path provided
     if obj_content and output_path:
@@ -531,34 +539,71 @@ def convert(data: bytes, output_path: str = None) -> str:
     return obj_content
 
 
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='mesh')
+    return _executor
+
+
+def convert_async(data: bytes, output_path: str = None) -> Future:
+    """
+    Convert Roblox mesh data to OBJ format on a worker thread
+
+    DracoPy releases the GIL while decoding, so v6/v7 meshes convert in
+    parallel with the caller and with each other.
+
+    Returns:
+        Future resolving to the OBJ content string, or None on failure
+    """
+    return _get_executor().submit(convert, data, output_path)
+
+
 # Standalone Usage
 
 if __name__ == "__main__":
+    import mmap
     import sys
+    from contextlib import ExitStack
     from pathlib import Path
 
     if len(sys.argv) < 2:
-        log_buffer.log('Mesh',"Usage: python mesh_processing.py <mesh_file>")
+        log_buffer.log('Mesh',"Usage: python mesh_processing.py <mesh_file> [<mesh_file> ...]")
         log_buffer.log('Mesh',"Example: python mesh_processing.py model.mesh")
         sys.exit(1)
 
-    mesh_path = Path(sys.argv[1])
-
-    if not mesh_path.exists():
-        log_buffer.log('Mesh',f"File not found: {mesh_path}")
-        sys.exit(1)
-
-    # Read mesh data
-    data = mesh_path.read_bytes()
-
-    # Convert to OBJ
-    output_path = mesh_path.with_suffix('.obj')
-    obj_content = convert(data, str(output_path))
+    mesh_paths = [Path(arg) for arg in sys.argv[1:]]
+
+    for mesh_path in mesh_paths:
+        if not mesh_path.exists():
+            log_buffer.log('Mesh',f"File not found: {mesh_path}")
+            sys.exit(1)
+
+    # Convert every file to OBJ in parallel, reading each through a
+    # read-only memory map instead of copying it into a bytes object
+    output_paths = [mesh_path.with_suffix('.obj') for mesh_path in mesh_paths]
+    failed = False
+    with ExitStack() as stack:
+        futures = []
+        for mesh_path, output_path in zip(mesh_paths, output_paths):
+            f = stack.enter_context(open(mesh_path, 'rb'))
+            if mesh_path.stat().st_size:
+                data = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = b''  # Empty files cannot be mapped
+            futures.append(convert_async(data, str(output_path)))
+
+        for mesh_path, output_path, future in zip(mesh_paths, output_paths, futures):
+            if future.result():
+                log_buffer.log('Mesh',f"\n✓ Conversion successful!")
+                log_buffer.log('Mesh',f"  Input:  {mesh_path}")
+                log_buffer.log('Mesh',f"  Output: {output_path}")
+            else:
+                log_buffer.log('Mesh',f"\n✗ Conversion failed: {mesh_path}")
+                failed = True
 
-    if obj_content:
-        log_buffer.log('Mesh',f"\n✓ Conversion successful!")
-        log_buffer.log('Mesh',f"  Input:  {mesh_path}")
-        log_buffer.log('Mesh',f"  Output: {output_path}")
-    else:
-        log_buffer.log('Mesh',"\n✗ Conversion failed")
+    if failed:
         sys.exit(1)
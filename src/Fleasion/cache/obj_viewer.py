@@ -1,4 +1,7 @@
-"""Simple 3D OBJ viewer widget using PyQt6 OpenGL with display list caching."""
+"""Simple 3D OBJ viewer widget using PyQt6 OpenGL with vertex buffer rendering."""
+
+import ctypes
+import re
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
 from PyQt6.QtCore import Qt, QTimer
@@ -8,16 +11,57 @@ import numpy as np
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+try:
+    import meshoptimizer
+    MESHOPT_AVAILABLE = True
+except ImportError:
+    MESHOPT_AVAILABLE = False
+
+
+# Vertex indices of the first three corners of an OBJ face line (the part
+# of each corner before any '/')
+_OBJ_FACE_RE = re.compile(r'^f\s+(\d+)\S*\s+(\d+)\S*\s+(\d+)', re.MULTILINE)
+
+
+# Packed vertex buffer row: normalized positions as int16 (scaled by
+# _POSITION_SCALE at draw time) and unit normals as int8, each padded to a
+# 4-byte boundary
+_PACKED_VERTEX_DTYPE = np.dtype([('position', '<i2', 4), ('normal', 'i1', 4)])
+_POSITION_SCALE = 32767.0
+
+
+def _parse_xyz(lines: list[str]) -> np.ndarray:
+    """Parse the three values after the keyword of 'v'/'vn' lines into (N, 3)."""
+    if not lines:
+        return np.empty((0, 3), dtype=np.float32)
+    return np.loadtxt(lines, dtype=np.float32, usecols=(1, 2, 3), ndmin=2)
+
+
+def _optimize_mesh_order(data: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Reorder triangles for GPU vertex-cache reuse and vertices for fetch locality."""
+    vertex_count = len(data)
+    optimized = np.empty_like(indices)
+    meshoptimizer.optimize_vertex_cache(optimized, indices, len(indices), vertex_count)
+
+    # remap[old] is each vertex's new slot, or ~0 if no face uses it
+    remap = np.empty(vertex_count, dtype=np.uint32)
+    unique = meshoptimizer.optimize_vertex_fetch_remap(remap, optimized, len(optimized), vertex_count)
+    used = remap != np.uint32(0xFFFFFFFF)
+    reordered = np.empty(unique, dtype=data.dtype)
+    reordered[remap[used]] = data[used]
+    return reordered, remap[optimized]
+
 
 class ObjViewerWidget(QOpenGLWidget):
     """OpenGL widget for displaying OBJ files with optimized rendering."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.vertices = []
-        self.faces = []
-        self.normals = []
-        self.face_normals = []  # Pre-computed face normals
+        # Mesh arrays: (N, 3) positions and normals, (M, 3) 0-based faces
+        self.vertices = np.empty((0, 3), dtype=np.float32)
+        self.faces = np.empty((0, 3), dtype=np.int64)
+        self.normals = np.empty((0, 3), dtype=np.float32)
+        self.face_normals = np.empty((0, 3), dtype=np.float32)  # Pre-computed face normals
 
         self.rotation_x = 0
         self.rotation_y = 0
@@ -26,9 +70,19 @@ class ObjViewerWidget(QOpenGLWidget):
 
         self.last_pos = None
 
-        # Display list for cached rendering
-        self.mesh_display_list = 0
+        # Vertex buffer holding packed position/normal rows, one entry
+        # per mesh vertex, and an index buffer with three entries per face;
+        # the arrays wait here until paintGL uploads them
+        self.mesh_vbo = 0
+        self.mesh_ibo = 0
+        self.index_count = 0
+        self._vertex_data = None
+        self._index_data = None
         self.needs_rebuild = False
+        # Vertex array object recording the buffer bindings and array
+        # pointers, when the context supports one
+        self.mesh_vao = 0
+        self._vao_supported = False
 
         # Setup format
         fmt = QSurfaceFormat()
@@ -42,47 +96,45 @@ class ObjViewerWidget(QOpenGLWidget):
 
     def load_obj_data(self, obj_content: str):
         """Load OBJ file content."""
-        self.vertices = []
-        self.faces = []
-        self.normals = []
-        self.face_normals = []
-
-        for line in obj_content.splitlines():
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-
-            parts = line.split()
-            if not parts:
-                continue
-
-            if parts[0] == 'v':
-                self.vertices.append([float(parts[1]), float(parts[2]), float(parts[3])])
-            elif parts[0] == 'vn':
-                self.normals.append([float(parts[1]), float(parts[2]), float(parts[3])])
-            elif parts[0] == 'f':
-                face = []
-                for part in parts[1:4]:
-                    indices = part.split('/')
-                    v_idx = int(indices[0]) - 1
-                    face.append(v_idx)
-                if len(face) == 3:
-                    self.faces.append(face)
-
-        if self.vertices:
+        # Bucket the records by type, then let numpy parse each bucket in C
+        lines = [line.strip() for line in obj_content.splitlines()]
+        v_lines = [line for line in lines if line.startswith('v ')]
+        vn_lines = [line for line in lines if line.startswith('vn ')]
+        f_text = '\n'.join(line for line in lines if line.startswith('f '))
+
+        vertices = _parse_xyz(v_lines)
+        normals = _parse_xyz(vn_lines)
+        faces = np.array(_OBJ_FACE_RE.findall(f_text), dtype=np.int64).reshape(-1, 3) - 1
+        self.load_mesh_arrays(vertices, faces, normals)
+
+    def load_mesh_arrays(self, positions: np.ndarray, faces: np.ndarray, normals: np.ndarray = None):
+        """Load a mesh from (N, 3) positions and (M, 3) 0-based face indices."""
+        self.vertices = np.array(positions, dtype=np.float32).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+        # Skip faces that reference vertices outside the mesh
+        valid = ((faces >= 0) & (faces < len(self.vertices))).all(axis=1)
+        self.faces = faces[valid]
+        if normals is None:
+            self.normals = np.empty((0, 3), dtype=np.float32)
+        else:
+            self.normals = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+        self.face_normals = np.empty((0, 3), dtype=np.float32)
+
+        if len(self.vertices):
             self._normalize_model()
             self._compute_face_normals()
+        self._build_vertex_data()
 
-        # Mark for display list rebuild
+        # Mark for vertex buffer upload
         self.needs_rebuild = True
         self.update()
 
     def _normalize_model(self):
         """Center and normalize model to fit in view."""
-        if not self.vertices:
+        if not len(self.vertices):
             return
 
-        vertices = np.array(self.vertices)
+        vertices = self.vertices
         center = vertices.mean(axis=0)
         vertices -= center
 
@@ -90,57 +142,112 @@ class ObjViewerWidget(QOpenGLWidget):
         if max_dim > 0:
             vertices /= max_dim
 
-        self.vertices = vertices.tolist()
-
     def _compute_face_normals(self):
         """Pre-compute face normals for performance."""
-        self.face_normals = []
-        vertices = np.array(self.vertices)
-
-        for face in self.faces:
-            if len(face) >= 3:
-                v0 = vertices[face[0]]
-                v1 = vertices[face[1]]
-                v2 = vertices[face[2]]
-
-                edge1 = v1 - v0
-                edge2 = v2 - v0
-                normal = np.cross(edge1, edge2)
-                norm = np.linalg.norm(normal)
-                if norm > 0:
-                    normal = normal / norm
-                else:
-                    normal = np.array([0.0, 1.0, 0.0])
-
-                self.face_normals.append(normal.tolist())
-            else:
-                self.face_normals.append([0.0, 1.0, 0.0])
-
-    def _build_display_list(self):
-        """Build display list for fast rendering."""
-        if self.mesh_display_list != 0:
-            glDeleteLists(self.mesh_display_list, 1)
-
-        self.mesh_display_list = glGenLists(1)
-        glNewList(self.mesh_display_list, GL_COMPILE)
-
-        if self.vertices and self.faces:
-            # Draw filled mesh
-            glColor3f(0.7, 0.7, 0.9)
-            glBegin(GL_TRIANGLES)
-
-            for i, face in enumerate(self.faces):
-                if len(face) >= 3 and i < len(self.face_normals):
-                    glNormal3fv(self.face_normals[i])
-                    for idx in face[:3]:
-                        if 0 <= idx < len(self.vertices):
-                            glVertex3fv(self.vertices[idx])
-
-            glEnd()
-
-        glEndList()
+        # All faces at once: (M, 3, 3) corner positions, one batched cross product
+        tri = self.vertices[self.faces]
+        normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        norms = np.linalg.norm(normals, axis=1, keepdims=True)
+
+        # Degenerate faces get an up-facing normal
+        degenerate = norms[:, 0] == 0
+        norms[degenerate] = 1.0
+        normals /= norms
+        normals[degenerate] = (0.0, 1.0, 0.0)
+        self.face_normals = normals
+
+    def _build_vertex_data(self):
+        """Build packed (position, smooth normal) rows and the face index array."""
+        if not len(self.vertices) or not len(self.faces):
+            self._vertex_data = np.empty(0, dtype=_PACKED_VERTEX_DTYPE)
+            self._index_data = np.empty(0, dtype=np.uint32)
+            return
+
+        faces = self.faces
+        # Smooth normals: average the normals of the faces around each vertex
+        vertex_normals = np.zeros_like(self.vertices)
+        np.add.at(vertex_normals, faces.ravel(), np.repeat(self.face_normals, 3, axis=0))
+        norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+        flat = norms[:, 0] == 0
+        norms[flat] = 1.0
+        vertex_normals /= norms
+        vertex_normals[flat] = (0.0, 1.0, 0.0)
+
+        # Both are within [-1, 1] after _normalize_model, so quantize to SNORM
+        data = np.zeros(len(self.vertices), dtype=_PACKED_VERTEX_DTYPE)
+        data['position'][:, :3] = np.rint(self.vertices * _POSITION_SCALE)
+        data['normal'][:, :3] = np.rint(vertex_normals * 127.0)
+        indices = faces.astype(np.uint32).ravel()
+        if MESHOPT_AVAILABLE:
+            data, indices = _optimize_mesh_order(data, indices)
+        self._vertex_data = data
+        self._index_data = indices
+
+    def _upload_vertex_data(self):
+        """Upload the pending vertex and index data into the mesh buffers."""
+        if self.mesh_vbo == 0:
+            self.mesh_vbo = glGenBuffers(1)
+        if self.mesh_ibo == 0:
+            self.mesh_ibo = glGenBuffers(1)
+
+        data = self._vertex_data
+        glBindBuffer(GL_ARRAY_BUFFER, self.mesh_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        indices = self._index_data
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.mesh_ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        # Record the array setup once so drawing is a single bind
+        if self._vao_supported:
+            if self.mesh_vao == 0:
+                self.mesh_vao = glGenVertexArrays(1)
+            glBindVertexArray(self.mesh_vao)
+            self._bind_mesh_arrays()
+            glBindVertexArray(0)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)  # Not part of the VAO state
+
+        self.index_count = len(indices)
+        self._vertex_data = None
+        self._index_data = None
         self.needs_rebuild = False
 
+    def _bind_mesh_arrays(self):
+        """Bind the mesh buffers and point the vertex and normal arrays into them."""
+        stride = _PACKED_VERTEX_DTYPE.itemsize
+        glBindBuffer(GL_ARRAY_BUFFER, self.mesh_vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.mesh_ibo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        # Fixed-function byte normals are normalized by GL; short positions
+        # are not, so _draw_mesh undoes the quantization scale
+        glVertexPointer(3, GL_SHORT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_BYTE, stride, ctypes.c_void_p(_PACKED_VERTEX_DTYPE.fields['normal'][1]))
+
+    def _draw_mesh(self):
+        """Draw the mesh vertex buffer in a single call."""
+        glColor3f(0.7, 0.7, 0.9)
+        if self.mesh_vao:
+            glBindVertexArray(self.mesh_vao)
+        else:
+            self._bind_mesh_arrays()
+        glPushMatrix()
+        scale = 1.0 / _POSITION_SCALE
+        glScalef(scale, scale, scale)
+
+        glDrawElements(GL_TRIANGLES, self.index_count, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+
+        glPopMatrix()
+        if self.mesh_vao:
+            glBindVertexArray(0)
+        else:
+            glDisableClientState(GL_NORMAL_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+
     def initializeGL(self):
         """Initialize OpenGL."""
         glEnable(GL_DEPTH_TEST)
@@ -164,6 +271,10 @@ class ObjViewerWidget(QOpenGLWidget):
         glClearColor(0.15, 0.15, 0.18, 1.0)
         glShadeModel(GL_SMOOTH)
 
+        # Vertex array objects need GL 3.0 or ARB_vertex_array_object;
+        # without one the arrays are set up on every draw instead
+        self._vao_supported = bool(glGenVertexArrays)
+
     def resizeGL(self, w: int, h: int):
         """Handle resize."""
         glViewport(0, 0, w, h)
@@ -174,7 +285,7 @@ class ObjViewerWidget(QOpenGLWidget):
         glMatrixMode(GL_MODELVIEW)
 
     def paintGL(self):
-        """Render the scene using cached display list."""
+        """Render the scene from the mesh vertex buffer."""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
 
@@ -183,14 +294,12 @@ class ObjViewerWidget(QOpenGLWidget):
         glRotatef(self.rotation_x, 1.0, 0.0, 0.0)
         glRotatef(self.rotation_y, 0.0, 1.0, 0.0)
 
-        if self.vertices and self.faces:
-            # Rebuild display list if needed
-            if self.needs_rebuild:
-                self._build_display_list()
+        # Upload new mesh data if needed
+        if self.needs_rebuild:
+            self._upload_vertex_data()
 
-            # Draw cached mesh
-            if self.mesh_display_list != 0:
-                glCallList(self.mesh_display_list)
+        if self.index_count:
+            self._draw_mesh()
 
         # Draw XYZ axis indicator
         self._draw_axis_indicator()
@@ -309,17 +418,31 @@ class ObjViewerWidget(QOpenGLWidget):
         self.update()
 
     def clear(self):
-        """Clear the mesh data and display list."""
-        self.vertices = []
-        self.faces = []
-        self.normals = []
-        self.face_normals = []
-        if self.mesh_display_list != 0:
+        """Clear the mesh data and buffers."""
+        self.vertices = np.empty((0, 3), dtype=np.float32)
+        self.faces = np.empty((0, 3), dtype=np.int64)
+        self.normals = np.empty((0, 3), dtype=np.float32)
+        self.face_normals = np.empty((0, 3), dtype=np.float32)
+        has_objects = self.mesh_vbo != 0 or self.mesh_ibo != 0 or self.mesh_vao != 0
+        # GL names belong to this widget's context, which isn't current when
+        # called from a GUI handler; without a context they are already gone
+        if has_objects and self.context() is not None:
+            self.makeCurrent()
             try:
-                glDeleteLists(self.mesh_display_list, 1)
+                if self.mesh_vbo != 0 or self.mesh_ibo != 0:
+                    glDeleteBuffers(2, [self.mesh_vbo, self.mesh_ibo])
+                if self.mesh_vao != 0:
+                    glDeleteVertexArrays(1, [self.mesh_vao])
             except Exception:
                 pass
-            self.mesh_display_list = 0
+            finally:
+                self.doneCurrent()
+        self.mesh_vbo = 0
+        self.mesh_ibo = 0
+        self.mesh_vao = 0
+        self.index_count = 0
+        self._vertex_data = None
+        self._index_data = None
         self.needs_rebuild = False
         self.update()
 
@@ -364,7 +487,16 @@ class ObjViewerPanel(QWidget):
     def load_obj(self, obj_content: str, asset_id: str = ''):
         """Load OBJ file content."""
         self.viewer.load_obj_data(obj_content)
+        self._update_stats()
+
+    def load_mesh(self, positions: np.ndarray, faces: np.ndarray, normals: np.ndarray = None,
+                  asset_id: str = ''):
+        """Load a mesh from arrays, skipping the OBJ text round trip."""
+        self.viewer.load_mesh_arrays(positions, faces, normals)
+        self._update_stats()
 
+    def _update_stats(self):
+        """Show the loaded mesh's vertex and face counts."""
         vertex_count = len(self.viewer.vertices)
         face_count = len(self.viewer.faces)
 
@@ -8,14 +8,17 @@ import zlib
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
 import lz4.block
+import numpy as np
 
 
 # Magic header for RBXM files
 RBXM_MAGIC = b'<roblox!'
 RBXM_SIGNATURE = bytes([0x89, 0xFF, 0x0D, 0x0A, 0x1A, 0x0A])
 
+_U32 = struct.Struct('<I')
 
-@dataclass
+
+@dataclass(slots=True)
 class RbxmInstance:
     """Represents a Roblox instance."""
     class_name: str
@@ -25,64 +28,62 @@ class RbxmInstance:
     parent: Optional['RbxmInstance'] = None
 
 
-def decode_interleaved_i32(data: bytes, count: int) -> List[int]:
-    """Decode interleaved 32-bit integers."""
-    if len(data) < count * 4:
-        return []
+class RbxmDocument(Dict[int, RbxmInstance]):
+    """Referent -> instance map returned by parse_rbxm, with lookup indexes.
 
-    result = []
-    for i in range(count):
-        # De-interleave: bytes are stored column-wise
-        b0 = data[i]
-        b1 = data[count + i]
-        b2 = data[count * 2 + i]
-        b3 = data[count * 3 + i]
+    roots and by_class are filled once parsing finishes, so
+    get_root_instances and find_by_class need not scan every instance.
+    """
+    __slots__ = ('roots', 'by_class')
 
-        # Reconstruct big-endian value
-        value = (b0 << 24) | (b1 << 16) | (b2 << 8) | b3
+    def __init__(self):
+        super().__init__()
+        self.roots: List[RbxmInstance] = []
+        self.by_class: Dict[str, List[RbxmInstance]] = {}
 
-        # Decode transformed integer (rotate right by 1, then negate if odd)
-        if value & 1:
-            value = -((value >> 1) + 1)
-        else:
-            value = value >> 1
 
-        result.append(value)
+def _deinterleave_u32(data: bytes, count: int) -> np.ndarray:
+    """Reassemble big-endian 32-bit words whose bytes are stored column-wise."""
+    planes = np.frombuffer(data, dtype=np.uint8, count=count * 4).reshape(4, count)
+    return np.ascontiguousarray(planes.T).view('>u4').ravel().astype(np.uint32)
 
-    return result
 
+def _decode_interleaved_i32_array(data: bytes, count: int) -> np.ndarray:
+    """Decode interleaved 32-bit integers into an int32 array."""
+    raw = _deinterleave_u32(data, count)
+    # Undo the zigzag transform (rotate right by 1, then negate if odd)
+    return ((raw >> 1) ^ -(raw & 1)).view(np.int32)
 
-def decode_interleaved_f32(data: bytes, count: int) -> List[float]:
-    """Decode interleaved 32-bit floats with Roblox's custom encoding."""
+
+def decode_interleaved_i32(data: bytes, count: int) -> List[int]:
+    """Decode interleaved 32-bit integers."""
     if len(data) < count * 4:
         return []
 
-    result = []
-    for i in range(count):
-        # De-interleave
-        b0 = data[i]
-        b1 = data[count + i]
-        b2 = data[count * 2 + i]
-        b3 = data[count * 3 + i]
+    return _decode_interleaved_i32_array(data, count).tolist()
 
-        # Reconstruct and convert from Roblox format to IEEE-754
-        # Roblox uses a rotated format where sign bit is at LSB
-        raw = (b0 << 24) | (b1 << 16) | (b2 << 8) | b3
 
-        # Rotate right by 1 to get standard IEEE-754 format
-        ieee = ((raw >> 1) | ((raw & 1) << 31)) & 0xFFFFFFFF
+def _decode_interleaved_f32_array(data: bytes, count: int) -> np.ndarray:
+    """Decode interleaved Roblox-encoded 32-bit floats into a float32 array."""
+    raw = _deinterleave_u32(data, count)
+    # Roblox stores the sign bit at the LSB; rotate right by 1 to get
+    # standard IEEE-754 bits, then reinterpret them in place
+    return ((raw >> 1) | (raw << 31)).view(np.float32)
 
-        # Convert to float
-        result.append(struct.unpack('<f', struct.pack('<I', ieee))[0])
 
-    return result
+def decode_interleaved_f32(data: bytes, count: int) -> List[float]:
+    """Decode interleaved 32-bit floats with Roblox's custom encoding."""
+    if len(data) < count * 4:
+        return []
+
+    return _decode_interleaved_f32_array(data, count).tolist()
 
 
 def read_string(data: bytes, offset: int) -> Tuple[str, int]:
     """Read a length-prefixed string."""
-    length = struct.unpack_from('<I', data, offset)[0]
+    length = _U32.unpack_from(data, offset)[0]
     offset += 4
-    value = data[offset:offset + length].decode('utf-8', errors='replace')
+    value = str(data[offset:offset + length], 'utf-8', 'replace')
     return value, offset + length
 
 
@@ -130,8 +131,17 @@ CFRAME_ROTATIONS = {
     0x19: [0, 0, -1, 0, -1, 0, -1, 0, 0],
 }
 
+# The same rotations as rows indexed by any rotation ID byte; IDs without
+# a predefined rotation map to identity. Read-only, since parsed CFrames
+# share views of these rows
+_CFRAME_ROTATION_TABLE = np.tile(np.eye(3, dtype=np.float32).ravel(), (256, 1))
+for _rot_id, _rot in CFRAME_ROTATIONS.items():
+    _CFRAME_ROTATION_TABLE[_rot_id] = _rot
+_CFRAME_ROTATION_TABLE.flags.writeable = False
+del _rot_id, _rot
+
 
-def parse_rbxm(data: bytes) -> Dict[int, RbxmInstance]:
+def parse_rbxm(data: bytes) -> RbxmDocument:
     """
     Parse RBXM binary data.
 
@@ -163,9 +173,13 @@ def parse_rbxm(data: bytes) -> Dict[int, RbxmInstance]:
 
     # Storage for parsing
     class_info: Dict[int, Tuple[str, List[int]]] = {}  # class_id -> (class_name, referents)
-    instances: Dict[int, RbxmInstance] = {}  # referent -> instance
+    instances = RbxmDocument()  # referent -> instance
     parent_refs: Dict[int, int] = {}  # child_ref -> parent_ref
 
+    # Chunks are handed to the parsers as views, so slicing them (and the
+    # slices the parsers take in turn) never copies
+    view = memoryview(data)
+
     # Parse chunks
     while offset < len(data):
         if offset + 16 > len(data):
@@ -186,10 +200,11 @@ def parse_rbxm(data: bytes) -> Dict[int, RbxmInstance]:
 
         # Get chunk data
         if compressed_size == 0:
-            chunk_data = data[offset:offset + uncompressed_size]
+            chunk_data = view[offset:offset + uncompressed_size]
             offset += uncompressed_size
         else:
-            chunk_data = decompress_chunk(data[offset:], compressed_size, uncompressed_size)
+            chunk_data = memoryview(decompress_chunk(
+                view[offset:offset + compressed_size], compressed_size, uncompressed_size))
             offset += compressed_size
 
         # Process chunk
@@ -211,6 +226,17 @@ def parse_rbxm(data: bytes) -> Dict[int, RbxmInstance]:
                 parent.children.append(child)
                 child.parent = parent
 
+    # Index the finished tree for get_root_instances and find_by_class
+    by_class = instances.by_class
+    for inst in instances.values():
+        if inst.parent is None:
+            instances.roots.append(inst)
+        class_list = by_class.get(inst.class_name)
+        if class_list is None:
+            by_class[inst.class_name] = [inst]
+        else:
+            class_list.append(inst)
+
     return instances
 
 
@@ -229,22 +255,18 @@ def _parse_inst_chunk(data: bytes, class_info: Dict, instances: Dict):
     instance_count = struct.unpack_from('<I', data, offset)[0]
     offset += 4
 
-    # Read referents (interleaved i32)
+    # Read referents (interleaved i32 deltas) and convert to absolute referents
     referents_data = data[offset:offset + instance_count * 4]
-    referent_deltas = decode_interleaved_i32(referents_data, instance_count)
-
-    # Convert deltas to absolute referents
-    referents = []
-    current = 0
-    for delta in referent_deltas:
-        current += delta
-        referents.append(current)
+    if len(referents_data) < instance_count * 4:
+        referents = []
+    else:
+        referent_deltas = _decode_interleaved_i32_array(referents_data, instance_count)
+        referents = np.cumsum(referent_deltas, dtype=np.int64).tolist()
 
     # Store class info and create instances
     class_info[class_id] = (class_name, referents)
 
-    for ref in referents:
-        instances[ref] = RbxmInstance(class_name=class_name, referent=ref)
+    instances.update({ref: RbxmInstance(class_name, ref, {}, [], None) for ref in referents})
 
 
 def _parse_prop_chunk(data: bytes, class_info: Dict, instances: Dict):
@@ -282,20 +304,24 @@ def _parse_prop_values(data: bytes, type_id: int, count: int) -> List[Any]:
     values = []
 
     if type_id == 0x01:  # String
+        # Walk the length prefixes inline; read_string per value costs a
+        # call and a tuple for every string
+        unpack_length = _U32.unpack_from
+        end = len(data)
         offset = 0
         for _ in range(count):
-            if offset >= len(data):
+            if offset >= end:
                 values.append('')
                 continue
-            s, offset = read_string(data, offset)
-            values.append(s)
+            length = unpack_length(data, offset)[0]
+            offset += 4
+            values.append(str(data[offset:offset + length], 'utf-8', 'replace'))
+            offset += length
 
     elif type_id == 0x02:  # Bool
-        for i in range(count):
-            if i < len(data):
-                values.append(bool(data[i]))
-            else:
-                values.append(False)
+        available = min(count, len(data))
+        values = np.frombuffer(data, dtype=np.uint8, count=available).astype(bool).tolist()
+        values += [False] * (count - available)
 
     elif type_id == 0x03:  # Int32
         values = decode_interleaved_i32(data, count)
@@ -304,12 +330,9 @@ def _parse_prop_values(data: bytes, type_id: int, count: int) -> List[Any]:
         values = decode_interleaved_f32(data, count)
 
     elif type_id == 0x05:  # Float64
-        for i in range(count):
-            offset = i * 8
-            if offset + 8 <= len(data):
-                values.append(struct.unpack_from('<d', data, offset)[0])
-            else:
-                values.append(0.0)
+        available = min(count, len(data) // 8)
+        values = np.frombuffer(data, dtype='<f8', count=available).tolist()
+        values += [0.0] * (count - available)
 
     elif type_id == 0x10:  # CFrame
         values = _parse_cframes(data, count)
@@ -324,13 +347,13 @@ def _parse_prop_values(data: bytes, type_id: int, count: int) -> List[Any]:
 def _parse_cframes(data: bytes, count: int) -> List[Dict]:
     """Parse CFrame values."""
     offset = 0
-    cframes = []
-    rotation_data = []
+    rotations = []
+    identity = _CFRAME_ROTATION_TABLE[0x02]
 
-    # First, read rotation IDs and custom rotations
+    # First, read rotation IDs and custom rotations as 9-float rows
     for _ in range(count):
         if offset >= len(data):
-            rotation_data.append((0x02, CFRAME_ROTATIONS[0x02]))
+            rotations.append(identity)
             continue
 
         rot_id = data[offset]
@@ -339,36 +362,28 @@ def _parse_cframes(data: bytes, count: int) -> List[Dict]:
         if rot_id == 0x00:
             # Custom rotation matrix (9 floats)
             if offset + 36 <= len(data):
-                rot = list(struct.unpack_from('<9f', data, offset))
+                rot = np.frombuffer(data, dtype='<f4', count=9, offset=offset)
                 offset += 36
             else:
-                rot = [1, 0, 0, 0, 1, 0, 0, 0, 1]
-            rotation_data.append((rot_id, rot))
+                rot = identity
+            rotations.append(rot)
         else:
             # Predefined rotation
-            rot = CFRAME_ROTATIONS.get(rot_id, [1, 0, 0, 0, 1, 0, 0, 0, 1])
-            rotation_data.append((rot_id, rot))
+            rotations.append(_CFRAME_ROTATION_TABLE[rot_id])
 
-    # Now read positions (interleaved Vector3s = 3 * count floats)
-    positions_x = decode_interleaved_f32(data[offset:], count)
-    offset += count * 4
-    positions_y = decode_interleaved_f32(data[offset:], count)
-    offset += count * 4
-    positions_z = decode_interleaved_f32(data[offset:], count)
+    # Now read positions (one interleaved f32 array per axis); an axis cut
+    # short by the end of the chunk stays zero
+    positions = np.zeros((count, 3), dtype=np.float32)
+    for axis in range(3):
+        if len(data) - offset >= count * 4:
+            positions[:, axis] = _decode_interleaved_f32_array(data[offset:], count)
+        offset += count * 4
 
     # Build CFrame dictionaries
-    for i in range(count):
-        rot_id, rot = rotation_data[i] if i < len(rotation_data) else (0x02, CFRAME_ROTATIONS[0x02])
-        x = positions_x[i] if i < len(positions_x) else 0.0
-        y = positions_y[i] if i < len(positions_y) else 0.0
-        z = positions_z[i] if i < len(positions_z) else 0.0
-
-        cframes.append({
-            'position': (x, y, z),
-            'rotation': rot
-        })
-
-    return cframes
+    return [
+        {'position': position, 'rotation': rot}
+        for position, rot in zip(map(tuple, positions.tolist()), rotations)
+    ]
 
 
 def _parse_prnt_chunk(data: bytes, instances: Dict, parent_refs: Dict):
@@ -381,36 +396,29 @@ def _parse_prnt_chunk(data: bytes, instances: Dict, parent_refs: Dict):
     count = struct.unpack_from('<I', data, offset)[0]
     offset += 4
 
-    # Read child referents
-    children = decode_interleaved_i32(data[offset:], count)
-    offset += count * 4
-
-    # Read parent referents
-    parents = decode_interleaved_i32(data[offset:], count)
-
-    # Convert deltas to absolute values
-    child_refs = []
-    parent_ref_list = []
-
-    child_current = 0
-    parent_current = 0
+    # Child referents then parent referents, both interleaved i32 deltas
+    if len(data) - offset < count * 8:
+        return
 
-    for i in range(min(len(children), len(parents))):
-        child_current += children[i]
-        parent_current += parents[i]
-        child_refs.append(child_current)
-        parent_ref_list.append(parent_current)
+    children = _decode_interleaved_i32_array(data[offset:], count)
+    offset += count * 4
+    parents = _decode_interleaved_i32_array(data[offset:], count)
 
-    # Store parent relationships
-    for i in range(len(child_refs)):
-        parent_refs[child_refs[i]] = parent_ref_list[i]
+    # Convert deltas to absolute values and store parent relationships
+    child_refs = np.cumsum(children, dtype=np.int64).tolist()
+    parent_ref_list = np.cumsum(parents, dtype=np.int64).tolist()
+    parent_refs.update(zip(child_refs, parent_ref_list))
 
 
 def get_root_instances(instances: Dict[int, RbxmInstance]) -> List[RbxmInstance]:
     """Get all root instances (those without parents)."""
+    if isinstance(instances, RbxmDocument):
+        return list(instances.roots)
     return [inst for inst in instances.values() if inst.parent is None]
 
 
 def find_by_class(instances: Dict[int, RbxmInstance], class_name: str) -> List[RbxmInstance]:
     """Find all instances of a given class."""
+    if isinstance(instances, RbxmDocument):
+        return list(instances.by_class.get(class_name, ()))
     return [inst for inst in instances.values() if inst.class_name == class_name]
@@ -1,18 +1,35 @@
 """Configuration management."""
 
+import atexit
 import json
+import os
 import threading
+import time
 from copy import deepcopy
 from pathlib import Path
 
 from ..utils import CONFIG_DIR, CONFIG_FILE, CONFIGS_FOLDER, DEFAULT_SETTINGS
 
+# Seconds to wait after a settings change before writing, so a burst of
+# changes is saved once
+SETTINGS_SAVE_DELAY = 0.1
+
+# Waits between attempts to swap a saved config into place. On Windows the
+# swap fails while a reader has the file open, which only lasts a moment
+CONFIG_REPLACE_RETRY_DELAYS = (0.01, 0.02, 0.05, 0.1, 0.2)
+
 
 class ConfigManager:
     """Manages application settings and replacement configurations."""
 
     def __init__(self):
         self._lock = threading.Lock()
+        self._save_timer: threading.Timer | None = None  # Pending settings write
+        self._saved_settings_text: str | None = None  # Last JSON written to disk
+        atexit.register(self._flush_pending_settings)
+        self._config_names_cache: list[str] | None = None  # None until next scan
+        # Config name -> ((mtime_ns, size), rules) for get_all_replacements
+        self._rules_cache: dict[str, tuple[tuple[int, int], list]] = {}
         self.settings = self._load_settings()
         self._ensure_default_config()
         # Clean up enabled_configs to only include existing configs
@@ -71,13 +88,37 @@ class ConfigManager:
             default_path = CONFIGS_FOLDER / 'Default.json'
             with Path(default_path).open('w') as f:
                 json.dump({'replacement_rules': []}, f, indent=2)
+            self._config_names_cache = None
 
     def _save_settings(self):
-        """Save settings to disk."""
+        """Schedule a settings save; changes made before it runs share one write."""
         with self._lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SETTINGS_SAVE_DELAY, self._flush_settings)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _flush_settings(self):
+        """Save settings to disk now, replacing any scheduled save."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            # Setters replace values rather than mutate them, so a shallow
+            # copy is a consistent snapshot
+            text = json.dumps(dict(self.settings), indent=2)
+            # Toggling a setting back and forth needs no write at all
+            if text == self._saved_settings_text:
+                return
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
             with Path(CONFIG_FILE).open('w') as f:
-                json.dump(self.settings, f, indent=2)
+                f.write(text)
+            self._saved_settings_text = text
+
+    def _flush_pending_settings(self):
+        """Write settings if a save is still scheduled (runs at exit)."""
+        if self._save_timer is not None:
+            self._flush_settings()
 
     def _get_config_path(self, name: str) -> Path:
         """Get the path for a config file."""
@@ -96,9 +137,38 @@ class ConfigManager:
 
     def _save_config(self, name: str, data: dict):
         """Save a config to disk."""
+        # Readers don't take the lock, so write to a temp file and swap it in;
+        # a concurrent load then sees either the old or the new config, never
+        # a partly written one
+        path = self._get_config_path(name)
+        tmp_path = path.with_suffix('.json.tmp')
         with self._lock:
             CONFIGS_FOLDER.mkdir(parents=True, exist_ok=True)
-            with Path(self._get_config_path(name)).open('w') as f:
+            try:
+                with tmp_path.open('w') as f:
+                    json.dump(data, f, indent=2)
+                self._replace_config_file(tmp_path, path, data)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            self._rules_cache.pop(name, None)
+            # A new file changes the config list
+            if self._config_names_cache is not None and name not in self._config_names_cache:
+                self._config_names_cache = None
+
+    @staticmethod
+    def _replace_config_file(tmp_path: Path, path: Path, data: dict):
+        """Swap a written temp file into place, retrying while the target is held open."""
+        for delay in CONFIG_REPLACE_RETRY_DELAYS:
+            try:
+                os.replace(tmp_path, path)
+                return
+            except PermissionError:
+                time.sleep(delay)
+        try:
+            os.replace(tmp_path, path)
+        except PermissionError:
+            # Still held open; write in place rather than lose the edit
+            with path.open('w') as f:
                 json.dump(data, f, indent=2)
 
     @property
@@ -270,13 +340,32 @@ class ConfigManager:
     @property
     def config_names(self) -> list[str]:
         """Get list of all config names."""
-        CONFIGS_FOLDER.mkdir(parents=True, exist_ok=True)
-        return sorted([p.stem for p in CONFIGS_FOLDER.glob('*.json')])
+        names = self._config_names_cache
+        if names is None:
+            CONFIGS_FOLDER.mkdir(parents=True, exist_ok=True)
+            names = self._config_names_cache = sorted([p.stem for p in CONFIGS_FOLDER.glob('*.json')])
+        return names.copy()
 
     def refresh_config_names(self):
         """Refresh config names from disk (for external changes)."""
-        # config_names property already reads from disk, this is just for clarity
-        pass
+        self._config_names_cache = None
+
+    def _get_cached_rules(self, config_name: str) -> list:
+        """Get rules for a config, re-reading the file only when it has changed.
+
+        The returned list is shared between calls and must not be modified.
+        """
+        try:
+            stat = self._get_config_path(config_name).stat()
+        except OSError:
+            return []
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._rules_cache.get(config_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        rules = self.get_replacement_rules(config_name)
+        self._rules_cache[config_name] = (key, rules)
+        return rules
 
     def get_replacement_rules(self, config_name: str) -> list:
         """Get rules for a specific config."""
@@ -299,8 +388,8 @@ class ConfigManager:
         self.set_replacement_rules(self.last_config, value)
 
     def save(self):
-        """Save settings."""
-        self._save_settings()
+        """Save settings immediately."""
+        self._flush_settings()
 
     def create_config(self, name: str) -> bool:
         """Create a new config. Returns True if successful."""
@@ -315,6 +404,7 @@ class ConfigManager:
             return False
         try:
             self._get_config_path(name).unlink()
+            self._config_names_cache = None
             # Remove from enabled configs if present
             if name in self.enabled_configs:
                 configs = self.enabled_configs.copy()
@@ -338,6 +428,7 @@ class ConfigManager:
             return False
         try:
             self._get_config_path(old_name).rename(self._get_config_path(new_name))
+            self._config_names_cache = None
             # Update enabled_configs
             if old_name in self.enabled_configs:
                 configs = self.enabled_configs.copy()
@@ -381,10 +472,11 @@ class ConfigManager:
         cdn_replacements: dict[int, str] = {}
         local_replacements: dict[int, str] = {}
 
+        config_names = set(self.config_names)
         for config_name in self.enabled_configs:
-            if config_name not in self.config_names:
+            if config_name not in config_names:
                 continue
-            for rule in self.get_replacement_rules(config_name):
+            for rule in self._get_cached_rules(config_name):
                 # Skip disabled profiles
                 if not rule.get('enabled', True):
                     continue
@@ -401,21 +493,24 @@ class ConfigManager:
                 elif mode == 'cdn':
                     cdn_url = rule.get('cdn_url')
                     if cdn_url:
-                        cdn_replacements.update(dict.fromkeys(ids, cdn_url))
+                        for asset_id in ids:
+                            cdn_replacements[asset_id] = cdn_url
                     else:
                         # Empty CDN URL means remove
                         removals.update(ids)
                 elif mode == 'local':
                     local_path = rule.get('local_path')
                     if local_path:
-                        local_replacements.update(dict.fromkeys(ids, local_path))
+                        for asset_id in ids:
+                            local_replacements[asset_id] = local_path
                     else:
                         # Empty local path means remove
                         removals.update(ids)
                 elif mode == 'id':
                     # Empty with_id means remove
                     if (target := rule.get('with_id')) is not None:
-                        replacements.update(dict.fromkeys(ids, target))
+                        for asset_id in ids:
+                            replacements[asset_id] = target
                     else:
                         removals.update(ids)
 
@@ -366,6 +366,7 @@ class ReplacerConfigWindow(QDialog):
         self.config_enabled_vars.clear()
 
         # Clean up enabled configs that no longer exist on disk
+        self.config_manager.refresh_config_names()
         current_configs = self.config_manager.config_names
         enabled = self.config_manager.enabled_configs
         for name in enabled[:]:  # Copy list to allow modification
@@ -459,6 +460,7 @@ class ReplacerConfigWindow(QDialog):
     def _rebuild_editing_menu(self):
         """Rebuild the editing config menu."""
         self.config_menu.clear()
+        self.config_manager.refresh_config_names()
         current_configs = self.config_manager.config_names
 
         # If current editing config was deleted, switch to first available
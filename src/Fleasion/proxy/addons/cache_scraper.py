@@ -21,6 +21,8 @@ import requests
 from ...cache.cache_manager import CacheManager
 from ...utils import log_buffer
 
+_COOKIE_RE = re.compile(rb'\.ROBLOSECURITY\s+([^\s;]+)')
+
 
 class CacheScraper:
     """Mitmproxy addon that intercepts and caches Roblox assets."""
@@ -362,9 +364,8 @@ class CacheScraper:
                 return None
             enc = base64.b64decode(cookies_data)
             dec = win32crypt.CryptUnprotectData(enc, None, None, None, 0)[1]
-            s = dec.decode(errors='ignore')
-            m = re.search(r'\.ROBLOSECURITY\s+([^\s;]+)', s)
-            return m.group(1) if m else None
+            m = _COOKIE_RE.search(dec)
+            return m.group(1).decode('ascii', errors='ignore') if m else None
         except Exception:
             return None
 